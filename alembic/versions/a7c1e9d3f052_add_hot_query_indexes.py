@@ -0,0 +1,61 @@
+"""add hot query indexes
+
+Revision ID: a7c1e9d3f052
+Revises: f5a8c3e1b794
+Create Date: 2026-10-17 19:02:37.481930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e9d3f052'
+down_revision: Union[str, Sequence[str], None] = 'f5a8c3e1b794'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction, so each
+# statement runs in an autocommit block and never blocks writes to a live
+# database. An interrupted concurrent build leaves an INVALID index behind,
+# which if_not_exists would skip, so any such leftover is dropped first.
+def _drop_invalid_index(name: str) -> None:
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in (
+            'ix_youtube_videos_pending_transcript',
+            'ix_anthropic_articles_pending_markdown',
+            'ix_digests_created_at',
+            'ix_digests_article',
+            'ix_content_fingerprints_published_at',
+        ):
+            _drop_invalid_index(name)
+        op.create_index('ix_youtube_videos_pending_transcript', 'youtube_videos', ['published_at'], unique=False, postgresql_where=sa.text('transcript IS NULL'), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_anthropic_articles_pending_markdown', 'anthropic_articles', ['published_at'], unique=False, postgresql_where=sa.text('markdown IS NULL'), postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_digests_created_at', 'digests', ['created_at'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_digests_article', 'digests', ['article_type', 'article_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_content_fingerprints_published_at', 'content_fingerprints', ['published_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_content_fingerprints_published_at', table_name='content_fingerprints', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_digests_article', table_name='digests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_digests_created_at', table_name='digests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_anthropic_articles_pending_markdown', table_name='anthropic_articles', postgresql_where=sa.text('markdown IS NULL'), postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_youtube_videos_pending_transcript', table_name='youtube_videos', postgresql_where=sa.text('transcript IS NULL'), postgresql_concurrently=True, if_exists=True)
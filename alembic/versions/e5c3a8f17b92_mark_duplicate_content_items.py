@@ -0,0 +1,36 @@
+"""mark duplicate content items
+
+Revision ID: e5c3a8f17b92
+Revises: d84b2f7e0c19
+Create Date: 2026-10-17 23:12:08.604113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c3a8f17b92'
+down_revision: Union[str, Sequence[str], None] = 'd84b2f7e0c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pending items with a duplicate fingerprint of their current content
+    # leave the pending set.
+    op.execute(
+        "UPDATE content_items SET status = 'duplicate' FROM content_fingerprints "
+        "WHERE content_fingerprints.id = content_items.key "
+        "AND content_fingerprints.content_hash IS NOT DISTINCT FROM content_items.content_hash "
+        "AND content_fingerprints.duplicate_of IS NOT NULL "
+        "AND content_items.status = 'pending'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE content_items SET status = 'pending' WHERE status = 'duplicate'")
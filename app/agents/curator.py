@@ -1,7 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List
-from openai import AsyncOpenAI, DefaultAioHttpClient
-from app.settings import settings
+from app.http_client import http
 
 
 class RankedArticle(BaseModel):
@@ -42,10 +41,7 @@ Rank articles from most relevant (rank 1) to least relevant. Ensure each article
 
 class CuratorAgent:
     def __init__(self, user_profile: dict):
-        self.client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            http_client=DefaultAioHttpClient(),
-        )
+        self.client = http.openai()
         self.model = "gpt-4.1"
         self.user_profile = user_profile
         self.system_prompt = self._build_system_prompt()
@@ -1,8 +1,7 @@
 from typing import Optional
 from pydantic import BaseModel
-from openai import AsyncOpenAI, DefaultAioHttpClient
 
-from app.settings import settings
+from app.http_client import http
 
 
 class DigestOutput(BaseModel):
@@ -32,10 +31,7 @@ class DigestAgent:
     def __init__(self):
         self.model = "gpt-4o-mini"
         self.system_prompt = PROMPT
-        self.client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            http_client=DefaultAioHttpClient(),
-        )
+        self.client = http.openai()
 
     async def generate_digest(
         self, title: str, content: str, article_type: str
@@ -1,8 +1,7 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from openai import AsyncOpenAI, DefaultAioHttpClient
-from app.settings import settings
+from app.http_client import http
 
 
 class RankedArticleDetail(BaseModel):
@@ -64,10 +63,7 @@ Keep it concise (2-3 sentences for the introduction), friendly, and professional
 
 class EmailAgent:
     def __init__(self, user_profile: dict):
-        self.client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            http_client=DefaultAioHttpClient(),
-        )
+        self.client = http.openai()
         self.model = "gpt-4o-mini"
         self.user_profile = user_profile
 
@@ -0,0 +1,58 @@
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.settings import settings
+
+
+class BatchWriter:
+    # Buffers keyed results and hands them to `write` in a single call once
+    # `max_size` are pending or the oldest has waited `max_delay` seconds.
+    # Thresholds are checked in add() rather than from a background task, so
+    # writes stay on the caller's session and never overlap its queries.
+    def __init__(
+        self,
+        write: Callable[[Dict[str, Any]], Awaitable[Any]],
+        max_size: int,
+        max_delay: Optional[float] = None,
+    ):
+        self.write = write
+        self.max_size = max_size
+        self.max_delay = (
+            settings.write_flush_interval if max_delay is None else max_delay
+        )
+        self.pending: Dict[str, Any] = {}
+        self.flushes = 0
+        self.written = 0
+        self._oldest: Optional[float] = None
+
+    def due(self) -> bool:
+        if not self.pending:
+            return False
+        return (
+            len(self.pending) >= self.max_size
+            or time.monotonic() - self._oldest >= self.max_delay
+        )
+
+    async def add(self, key: str, value: Any) -> None:
+        if not self.pending:
+            self._oldest = time.monotonic()
+        self.pending[key] = value
+        if self.due():
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        batch = self.pending
+        self.pending = {}
+        self._oldest = None
+        self.flushes += 1
+        self.written += len(batch)
+        await self.write(batch)
+
+    async def __aenter__(self) -> "BatchWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
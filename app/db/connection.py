@@ -1,16 +1,118 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.settings import settings
 
-engine = create_async_engine(settings.database_url)
+
+def _server_settings() -> Dict[str, str]:
+    # Postgres takes these in milliseconds; 0 disables the limit.
+    return {
+        "statement_timeout": str(int(settings.db_statement_timeout * 1000)),
+        "idle_in_transaction_session_timeout": str(
+            int(settings.db_idle_in_transaction_timeout * 1000)
+        ),
+    }
+
+
+engine = create_async_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args={
+        # SQLAlchemy's asyncpg dialect keeps its own prepared-statement cache
+        # per connection; set both to 0 behind a transaction-mode pgbouncer.
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        "statement_cache_size": settings.db_prepared_statement_cache_size,
+        "server_settings": _server_settings(),
+    },
+)
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
 
+class PoolMetrics:
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidated = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def on_connect(self, *args) -> None:
+        self.connects += 1
+
+    def on_checkout(self, *args) -> None:
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def on_checkin(self, *args) -> None:
+        self.checkins += 1
+        self.in_use = max(self.in_use - 1, 0)
+
+    def on_invalidate(self, *args) -> None:
+        self.invalidated += 1
+
+    def record_wait(self, seconds: float) -> None:
+        self.waits += 1
+        self.wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = engine.sync_engine.pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidated": self.invalidated,
+            "peak_in_use": self.peak_in_use,
+            "avg_wait_ms": round(self.wait_seconds / self.waits * 1000, 2)
+            if self.waits
+            else None,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+pool_metrics = PoolMetrics()
+_pool = engine.sync_engine.pool
+event.listen(_pool, "connect", pool_metrics.on_connect)
+event.listen(_pool, "checkout", pool_metrics.on_checkout)
+event.listen(_pool, "checkin", pool_metrics.on_checkin)
+event.listen(_pool, "invalidate", pool_metrics.on_invalidate)
+
+
 def get_session() -> AsyncSession:
     return AsyncSessionLocal()
 
 
+# A session for one unit of work. The connection is checked out up front so
+# the time spent waiting on the pool is measured, and returned on exit.
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    session = AsyncSessionLocal()
+    try:
+        start = time.perf_counter()
+        await session.connection()
+        pool_metrics.record_wait(time.perf_counter() - start)
+        yield session
+    finally:
+        await session.close()
+
+
 def get_engine():
     return engine
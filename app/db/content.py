@@ -0,0 +1,105 @@
+import hashlib
+from compression import zstd
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.settings import settings
+from .models import ContentBlob, ContentDictionary
+
+REF_PREFIX = "blob:sha256:"
+
+# Dictionaries never change once written, so they are cached per process.
+_dictionaries: Dict[int, zstd.ZstdDict] = {}
+
+
+def is_ref(value: Optional[str]) -> bool:
+    return bool(value) and value.startswith(REF_PREFIX)
+
+
+def content_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ContentStore:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _dictionary(self, dict_id: int) -> zstd.ZstdDict:
+        if dict_id not in _dictionaries:
+            row = await self.session.get(ContentDictionary, dict_id)
+            _dictionaries[dict_id] = zstd.ZstdDict(row.data)
+        return _dictionaries[dict_id]
+
+    async def _latest_dictionary_id(self) -> Optional[int]:
+        result = await self.session.execute(
+            select(ContentDictionary.id).order_by(ContentDictionary.id.desc()).limit(1)
+        )
+        return result.scalars().first()
+
+    async def put_many(self, texts: Iterable[str]) -> List[str]:
+        texts = list(texts)
+        if not texts:
+            return []
+
+        dict_id = await self._latest_dictionary_id()
+        zstd_dict = await self._dictionary(dict_id) if dict_id else None
+        rows = {}
+        refs = []
+        for text in texts:
+            key = content_key(text)
+            refs.append(REF_PREFIX + key)
+            if key in rows:
+                continue
+            raw = text.encode()
+            rows[key] = {
+                "hash": key,
+                "dict_id": dict_id,
+                "raw_length": len(raw),
+                "data": zstd.compress(
+                    raw, level=settings.content_zstd_level, zstd_dict=zstd_dict
+                ),
+            }
+
+        stmt = insert(ContentBlob).values(list(rows.values()))
+        await self.session.execute(stmt.on_conflict_do_nothing())
+        return refs
+
+    async def put(self, text: str) -> str:
+        return (await self.put_many([text]))[0]
+
+    async def get_many(self, refs: Iterable[str]) -> Dict[str, str]:
+        keys = {ref[len(REF_PREFIX) :] for ref in refs if is_ref(ref)}
+        if not keys:
+            return {}
+        result = await self.session.execute(
+            select(ContentBlob).filter(ContentBlob.hash.in_(keys))
+        )
+        contents = {}
+        for blob in result.scalars().all():
+            zstd_dict = await self._dictionary(blob.dict_id) if blob.dict_id else None
+            contents[REF_PREFIX + blob.hash] = zstd.decompress(
+                blob.data, zstd_dict=zstd_dict
+            ).decode()
+        return contents
+
+    async def get(self, ref: str) -> Optional[str]:
+        return (await self.get_many([ref])).get(ref)
+
+    # Values that aren't refs are legacy inline content and pass through.
+    async def resolve_many(self, values: List[Optional[str]]) -> List[Optional[str]]:
+        contents = await self.get_many(v for v in values if is_ref(v))
+        return [contents.get(v, v) if is_ref(v) else v for v in values]
+
+    async def train_dictionary(self, samples: List[str]) -> int:
+        trained = zstd.train_dict(
+            [sample.encode() for sample in samples], settings.content_dict_size
+        )
+        dictionary = ContentDictionary(
+            data=trained.dict_content, sample_count=len(samples)
+        )
+        self.session.add(dictionary)
+        await self.session.flush()
+        return dictionary.id
@@ -1,5 +1,20 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Text,
+    Float,
+    BigInteger,
+    Integer,
+    Computed,
+    LargeBinary,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -15,8 +30,21 @@ class YouTubeVideo(Base):
     published_at = Column(DateTime, nullable=False)
     description = Column(Text)
     transcript = Column(Text, nullable=True)
+    transcript_length = Column(Integer, nullable=True)
+    raw_transcript = Column(Text, nullable=True)
+    transcript_compression = Column(Float, nullable=True)
+    content_hash = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Pending-work index: only videos still waiting for a transcript.
+        Index(
+            "ix_youtube_videos_pending_transcript",
+            "published_at",
+            postgresql_where=text("transcript IS NULL"),
+        ),
+    )
+
 
 class OpenAIArticle(Base):
     __tablename__ = "openai_articles"
@@ -27,6 +55,7 @@ class OpenAIArticle(Base):
     description = Column(Text)
     published_at = Column(DateTime, nullable=False)
     category = Column(String, nullable=True)
+    content_hash = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
@@ -40,8 +69,69 @@ class AnthropicArticle(Base):
     published_at = Column(DateTime, nullable=False)
     category = Column(String, nullable=True)
     markdown = Column(Text, nullable=True)
+    markdown_length = Column(Integer, nullable=True)
+    content_hash = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index(
+            "ix_anthropic_articles_pending_markdown",
+            "published_at",
+            postgresql_where=text("markdown IS NULL"),
+        ),
+    )
+
+
+class RssArticle(Base):
+    __tablename__ = "rss_articles"
+
+    guid = Column(String, primary_key=True)
+    source = Column(String, nullable=False)
+    title = Column(String, nullable=False)
+    url = Column(String, nullable=False)
+    description = Column(Text)
+    published_at = Column(DateTime, nullable=False)
+    category = Column(String, nullable=True)
+    content_hash = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# One row per scraped item across every source, kept in step with the
+# per-source tables. Digest selection reads only this table. status is
+# "waiting" (transcript or markdown not fetched yet), "unavailable" (no
+# transcript), "pending" (ready for a digest), "duplicate" (a near-duplicate
+# of another story) or "digested". A digest worker holds a pending item
+# through leased_by until lease_expires_at.
+class ContentItem(Base):
+    __tablename__ = "content_items"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_type = Column(String, nullable=False)
+    source_id = Column(String, nullable=False)
+    key = Column(String, Computed("source_type || ':' || source_id", persisted=True), nullable=False)
+    title = Column(String, nullable=False)
+    url = Column(String, nullable=False)
+    published_at = Column(DateTime, nullable=False)
+    content = Column(Text, nullable=True)
+    content_hash = Column(String, nullable=True)
+    status = Column(String, nullable=False)
+    extras = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    leased_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("source_type", "source_id"),
+        Index(
+            "ix_content_items_pending",
+            "published_at",
+            "id",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("ix_content_items_published_at", "published_at"),
+    )
+
 
 class Digest(Base):
     __tablename__ = "digests"
@@ -52,4 +142,100 @@ class Digest(Base):
     url = Column(String, nullable=False)
     title = Column(String, nullable=False)
     summary = Column(Text, nullable=False)
+    content_hash = Column(String, nullable=True)
+    content_item_id = Column(Integer, ForeignKey("content_items.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_digests_created_at", "created_at"),
+        Index("ix_digests_article", "article_type", "article_id"),
+        Index("ix_digests_content_item_id", "content_item_id"),
+    )
+
+
+class FeedValidator(Base):
+    __tablename__ = "feed_validators"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    body_hash = Column(String, nullable=True)
+    checked_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ContentFingerprint(Base):
+    __tablename__ = "content_fingerprints"
+
+    id = Column(String, primary_key=True)
+    article_type = Column(String, nullable=False)
+    article_id = Column(String, nullable=False)
+    signature = Column(ARRAY(BigInteger), nullable=False)
+    duplicate_of = Column(String, nullable=True)
+    similarity = Column(Float, nullable=True)
+    # Hash of the content the signature was computed from; a fingerprint whose
+    # hash no longer matches its item is stale and gets recomputed.
+    content_hash = Column(String, nullable=True)
+    published_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Rows arrive roughly in publish order, so a BRIN index stays tiny.
+        Index(
+            "ix_content_fingerprints_published_at",
+            "published_at",
+            postgresql_using="brin",
+        ),
+    )
+
+
+class ContentDictionary(Base):
+    __tablename__ = "content_dictionaries"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    data = Column(LargeBinary, nullable=False)
+    sample_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ContentBlob(Base):
+    __tablename__ = "content_blobs"
+
+    hash = Column(String, primary_key=True)
+    dict_id = Column(Integer, ForeignKey("content_dictionaries.id"), nullable=True)
+    raw_length = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class PageArchive(Base):
+    __tablename__ = "page_archive"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    body_hash = Column(String, nullable=False)
+    fetched_at = Column(DateTime, nullable=False)
+
+
+class PageConversion(Base):
+    __tablename__ = "page_conversions"
+
+    body_hash = Column(String, primary_key=True)
+    converter_version = Column(String, primary_key=True)
+    markdown_hash = Column(String, nullable=False)
+    markdown_length = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# One row per item that failed a pipeline stage ("transcript", "markdown",
+# "digest"); item_key is "<type>:<id>". Removed once the stage succeeds.
+class StageFailure(Base):
+    __tablename__ = "stage_failures"
+
+    stage = Column(String, primary_key=True)
+    item_key = Column(String, primary_key=True)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
+    last_attempt_at = Column(DateTime, nullable=False)
+    next_attempt_at = Column(DateTime, nullable=True)
+    dead_lettered_at = Column(DateTime, nullable=True)
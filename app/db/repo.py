@@ -1,17 +1,51 @@
 from datetime import timedelta, timezone, datetime
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from .models import YouTubeVideo, OpenAIArticle, AnthropicArticle, Digest
+from sqlalchemy import (
+    DateTime,
+    Interval,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from .models import (
+    YouTubeVideo,
+    OpenAIArticle,
+    AnthropicArticle,
+    RssArticle,
+    ContentItem,
+    Digest,
+    FeedValidator,
+    ContentFingerprint,
+    PageArchive,
+    PageConversion,
+    StageFailure,
+)
 from .connection import get_session
-from app.scrapers.youtube import YoutubeVideo as PydanticYoutubeVideo
-from app.scrapers.openai import OpenAIArticle as PydanticOpenAIArticle
-from app.scrapers.anthropic import AnthropicArticle as PydanticAnthropicArticle
+from app.settings import settings
+from .content import REF_PREFIX, ContentStore, content_key
+from app.scrapers.youtube import YoutubeVideo as YoutubeVideoRecord
+from app.scrapers.openai import OpenAIArticle as OpenAIArticleRecord
+from app.scrapers.anthropic import AnthropicArticle as AnthropicArticleRecord
+from app.scrapers.rss import RssArticle as RssArticleRecord
+
+
+TRANSCRIPT_MARKERS = ("__UNAVAILABLE__",)
 
 
 class Repository:
     def __init__(self, session: Optional[AsyncSession] = None):
         self.session = session or get_session()
+        self.content = ContentStore(self.session)
 
     async def create_youtube_video(
         self,
@@ -23,13 +57,7 @@ class Repository:
         description: str = "",
         transcript: Optional[str] = None,
     ) -> Optional[YouTubeVideo]:
-        result = await self.session.execute(
-            select(YouTubeVideo).filter_by(video_id=video_id)
-        )
-        existing = result.scalars().first()
-        if existing:
-            return None
-        video = YouTubeVideo(
+        stmt = insert(YouTubeVideo).values(
             video_id=video_id,
             title=title,
             url=url,
@@ -38,9 +66,7 @@ class Repository:
             description=description,
             transcript=transcript,
         )
-        self.session.add(video)
-        await self.session.commit()
-        return video
+        return await self._create_one(stmt, YouTubeVideo)
 
     async def create_openai_article(
         self,
@@ -51,21 +77,16 @@ class Repository:
         description: str = "",
         category: Optional[str] = None,
     ) -> Optional[OpenAIArticle]:
-        result = await self.session.execute(select(OpenAIArticle).filter_by(guid=guid))
-        existing = result.scalars().first()
-        if existing:
-            return None
-        article = OpenAIArticle(
+        stmt = insert(OpenAIArticle).values(
             guid=guid,
             title=title,
             url=url,
             published_at=published_at,
             description=description,
             category=category,
+            content_hash=content_key(description or ""),
         )
-        self.session.add(article)
-        await self.session.commit()
-        return article
+        return await self._create_one(stmt, OpenAIArticle)
 
     async def create_anthropic_article(
         self,
@@ -76,13 +97,7 @@ class Repository:
         description: str = "",
         category: Optional[str] = None,
     ) -> Optional[AnthropicArticle]:
-        result = await self.session.execute(
-            select(AnthropicArticle).filter_by(guid=guid)
-        )
-        existing = result.scalars().first()
-        if existing:
-            return None
-        article = AnthropicArticle(
+        stmt = insert(AnthropicArticle).values(
             guid=guid,
             title=title,
             url=url,
@@ -90,108 +105,526 @@ class Repository:
             description=description,
             category=category,
         )
-        self.session.add(article)
+        return await self._create_one(stmt, AnthropicArticle)
+
+    # Returns the new row, or None when one with the same key already exists.
+    async def _create_one(self, stmt, model):
+        result = await self.session.execute(
+            stmt.on_conflict_do_nothing().returning(model)
+        )
+        row = result.scalars().first()
+        if row is not None:
+            _, id_column, _ = self._content_item_columns(model)
+            await self._sync_content_items(model, [getattr(row, id_column.key)])
         await self.session.commit()
-        return article
+        return row
 
-    async def bulk_create_youtube_videos(
-        self, videos: List[PydanticYoutubeVideo]
-    ) -> int:
-        new_videos = []
-        for v in videos:
-            result = await self.session.execute(
-                select(YouTubeVideo).filter_by(video_id=v.video_id)
+    # How a per-source table maps onto content_items: (source type, id column,
+    # content_items columns computed from the source row).
+    @staticmethod
+    def _content_item_columns(model) -> Tuple[str, Any, Dict[str, Any]]:
+        if model is YouTubeVideo:
+            return (
+                "youtube",
+                YouTubeVideo.video_id,
+                {
+                    "content": YouTubeVideo.transcript,
+                    "status": case(
+                        (YouTubeVideo.transcript.is_(None), "waiting"),
+                        (YouTubeVideo.transcript.in_(TRANSCRIPT_MARKERS), "unavailable"),
+                        else_="pending",
+                    ),
+                    "extras": func.jsonb_build_object(
+                        "channel_id", YouTubeVideo.channel_id
+                    ),
+                },
+            )
+        if model is AnthropicArticle:
+            return (
+                "anthropic",
+                AnthropicArticle.guid,
+                {
+                    "content": AnthropicArticle.markdown,
+                    "status": case(
+                        (AnthropicArticle.markdown.is_(None), "waiting"),
+                        else_="pending",
+                    ),
+                    "extras": func.jsonb_strip_nulls(
+                        func.jsonb_build_object("category", AnthropicArticle.category)
+                    ),
+                },
             )
-            existing = result.scalars().first()
-            if not existing:
-                new_video = YouTubeVideo(
-                    video_id=v.video_id,
-                    title=v.title,
-                    url=v.link,
-                    channel_id=v.channel_id,
-                    published_at=v.published_at,
-                    description=v.description,
-                    transcript=v.transcript,
+        if model is OpenAIArticle:
+            return (
+                "openai",
+                OpenAIArticle.guid,
+                {
+                    "content": func.coalesce(OpenAIArticle.description, ""),
+                    "status": literal("pending"),
+                    "extras": func.jsonb_strip_nulls(
+                        func.jsonb_build_object("category", OpenAIArticle.category)
+                    ),
+                },
+            )
+        return (
+            "rss",
+            RssArticle.guid,
+            {
+                "content": func.coalesce(RssArticle.description, ""),
+                "status": literal("pending"),
+                "extras": func.jsonb_strip_nulls(
+                    func.jsonb_build_object(
+                        "source", RssArticle.source, "category", RssArticle.category
+                    )
+                ),
+            },
+        )
+
+    # Copies source rows into content_items in the caller's transaction. A
+    # row is only rewritten when something changed, and an item whose digest
+    # still matches its content goes back to digested.
+    async def _sync_content_items(self, model, ids: List[str]) -> None:
+        if not ids:
+            return
+        source_type, id_column, columns = self._content_item_columns(model)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        stmt = insert(ContentItem).from_select(
+            [
+                "source_type",
+                "source_id",
+                "title",
+                "url",
+                "published_at",
+                "content",
+                "content_hash",
+                "status",
+                "extras",
+                "created_at",
+                "updated_at",
+            ],
+            select(
+                literal(source_type),
+                id_column,
+                model.title,
+                model.url,
+                model.published_at,
+                columns["content"],
+                model.content_hash,
+                columns["status"],
+                columns["extras"],
+                literal(now),
+                literal(now),
+            ).filter(id_column.in_(ids)),
+        )
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContentItem.source_type, ContentItem.source_id],
+            set_={
+                "title": excluded.title,
+                "url": excluded.url,
+                "published_at": excluded.published_at,
+                "content": excluded.content,
+                "content_hash": excluded.content_hash,
+                "status": excluded.status,
+                "extras": excluded.extras,
+                "updated_at": excluded.updated_at,
+            },
+            where=tuple_(
+                ContentItem.title,
+                ContentItem.url,
+                ContentItem.published_at,
+                ContentItem.content,
+                ContentItem.content_hash,
+                ContentItem.extras,
+            ).is_distinct_from(
+                tuple_(
+                    excluded.title,
+                    excluded.url,
+                    excluded.published_at,
+                    excluded.content,
+                    excluded.content_hash,
+                    excluded.extras,
                 )
-                new_videos.append(new_video)
-        if new_videos:
-            self.session.add_all(new_videos)
-            await self.session.commit()
-        return len(new_videos)
+            ),
+        )
+        await self.session.execute(stmt)
+        filters = (ContentItem.source_type == source_type, ContentItem.source_id.in_(ids))
+        await self._mark_digested(*filters)
+        await self._mark_duplicates(*filters)
 
-    async def bulk_create_openai_articles(
-        self, articles: List[PydanticOpenAIArticle]
-    ) -> int:
-        new_articles = []
-        for article in articles:
-            result = await self.session.execute(
-                select(OpenAIArticle).filter_by(guid=article.guid)
+    # Inserts rows in chunks with one INSERT ... ON CONFLICT ... RETURNING per
+    # chunk and returns the keys of the rows that were actually inserted.
+    # `on_conflict` turns the insert into an upsert; it defaults to DO NOTHING.
+    async def _ingest(
+        self, model, key: str, rows: List[Dict[str, Any]], on_conflict=None
+    ) -> List[str]:
+        # Postgres rejects an upsert that touches the same row twice, so
+        # repeated keys keep their first occurrence.
+        unique: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            unique.setdefault(row[key], row)
+        rows = list(unique.values())
+
+        new_keys = []
+        size = settings.ingest_chunk_size
+        for start in range(0, len(rows), size):
+            stmt = insert(model).values(rows[start : start + size])
+            if on_conflict is None:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[key])
+            else:
+                stmt = on_conflict(stmt)
+            # xmax is 0 only for freshly inserted tuples, which tells inserts
+            # apart from conflict updates in the RETURNING rows.
+            stmt = stmt.returning(getattr(model, key), literal_column("xmax = 0"))
+            result = await self.session.execute(stmt)
+            written = result.all()
+            new_keys.extend(k for k, inserted in written if inserted)
+            await self._sync_content_items(model, [k for k, _ in written])
+        await self.session.commit()
+        return new_keys
+
+    @staticmethod
+    def _update_changed_description(model):
+        def on_conflict(stmt):
+            return stmt.on_conflict_do_update(
+                index_elements=[model.guid],
+                set_={
+                    "title": stmt.excluded.title,
+                    "description": stmt.excluded.description,
+                    "content_hash": stmt.excluded.content_hash,
+                },
+                where=model.content_hash.is_distinct_from(stmt.excluded.content_hash),
             )
-            existing = result.scalars().first()
-            if not existing:
-                new_article = OpenAIArticle(
-                    guid=article.guid,
-                    title=article.title,
-                    url=article.url,
-                    published_at=article.published_at,
-                    description=article.description,
-                    category=article.category,
-                )
-                new_articles.append(new_article)
-        if new_articles:
-            self.session.add_all(new_articles)
-            await self.session.commit()
-        return len(new_articles)
+
+        return on_conflict
+
+    async def bulk_create_youtube_videos(
+        self, videos: List[YoutubeVideoRecord]
+    ) -> List[str]:
+        rows = [
+            {
+                "video_id": v.video_id,
+                "title": v.title,
+                "url": v.link,
+                "channel_id": v.channel_id,
+                "published_at": v.published_at,
+                "description": v.description,
+                "transcript": v.transcript,
+            }
+            for v in videos
+        ]
+        return await self._ingest(YouTubeVideo, "video_id", rows)
+
+    async def bulk_create_openai_articles(
+        self, articles: List[OpenAIArticleRecord]
+    ) -> List[str]:
+        rows = [
+            {
+                "guid": article.guid,
+                "title": article.title,
+                "url": article.url,
+                "published_at": article.published_at,
+                "description": article.description,
+                "category": article.category,
+                "content_hash": content_key(article.description or ""),
+            }
+            for article in articles
+        ]
+        return await self._ingest(
+            OpenAIArticle, "guid", rows, self._update_changed_description(OpenAIArticle)
+        )
 
     async def bulk_create_anthropic_articles(
-        self, articles: List[PydanticAnthropicArticle]
-    ) -> int:
-        new_articles = []
-        for article in articles:
-            result = await self.session.execute(
-                select(AnthropicArticle).filter_by(guid=article.guid)
+        self, articles: List[AnthropicArticleRecord]
+    ) -> List[str]:
+        rows = [
+            {
+                "guid": article.guid,
+                "title": article.title,
+                "url": article.url,
+                "published_at": article.published_at,
+                "description": article.description,
+                "category": article.category,
+            }
+            for article in articles
+        ]
+
+        # A post whose feed title or description changed has its markdown
+        # cleared so it is fetched again, which gives it a fresh content
+        # hash. Body-only edits, and posts that have left the feed window,
+        # are not picked up.
+        def on_conflict(stmt):
+            return stmt.on_conflict_do_update(
+                index_elements=[AnthropicArticle.guid],
+                set_={
+                    "title": stmt.excluded.title,
+                    "description": stmt.excluded.description,
+                    "markdown": None,
+                    "markdown_length": None,
+                    "content_hash": None,
+                },
+                where=or_(
+                    AnthropicArticle.title.is_distinct_from(stmt.excluded.title),
+                    AnthropicArticle.description.is_distinct_from(
+                        stmt.excluded.description
+                    ),
+                ),
             )
-            existing = result.scalars().first()
-            if not existing:
-                new_article = AnthropicArticle(
-                    guid=article.guid,
-                    title=article.title,
-                    url=article.url,
-                    published_at=article.published_at,
-                    description=article.description,
-                    category=article.category,
-                )
-                new_articles.append(new_article)
-        if new_articles:
-            self.session.add_all(new_articles)
-            await self.session.commit()
-        return len(new_articles)
+
+        return await self._ingest(AnthropicArticle, "guid", rows, on_conflict)
+
+    async def bulk_create_rss_articles(
+        self, articles: List[RssArticleRecord]
+    ) -> List[str]:
+        rows = [
+            {
+                "guid": article.guid,
+                "source": article.source,
+                "title": article.title,
+                "url": article.url,
+                "published_at": article.published_at,
+                "description": article.description,
+                "category": article.category,
+                "content_hash": content_key(article.description or ""),
+            }
+            for article in articles
+        ]
+        return await self._ingest(
+            RssArticle, "guid", rows, self._update_changed_description(RssArticle)
+        )
+
+    async def get_feed_validators(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not urls:
+            return {}
+        result = await self.session.execute(
+            select(FeedValidator).filter(FeedValidator.url.in_(urls))
+        )
+        return {
+            v.url: {
+                "etag": v.etag,
+                "last_modified": v.last_modified,
+                "body_hash": v.body_hash,
+                "checked_at": v.checked_at,
+            }
+            for v in result.scalars().all()
+        }
+
+    async def upsert_feed_validators(self, validators: List[Dict[str, Any]]) -> int:
+        if not validators:
+            return 0
+        rows = [
+            {
+                "url": v["url"],
+                "etag": v.get("etag"),
+                "last_modified": v.get("last_modified"),
+                "body_hash": v.get("body_hash"),
+                "checked_at": v.get("checked_at"),
+            }
+            for v in validators
+        ]
+        stmt = insert(FeedValidator).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FeedValidator.url],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "body_hash": stmt.excluded.body_hash,
+                "checked_at": stmt.excluded.checked_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return len(rows)
 
     async def get_anthropic_articles_without_markdown(
         self, limit: Optional[int] = None
     ) -> List[AnthropicArticle]:
-        stmt = select(AnthropicArticle).filter(AnthropicArticle.markdown.is_(None))
+        stmt = select(AnthropicArticle).filter(
+            AnthropicArticle.markdown.is_(None),
+            func.concat("anthropic:", AnthropicArticle.guid).notin_(
+                self._blocked_keys("markdown")
+            ),
+        )
         if limit:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_archived_anthropic_articles(self) -> List[Dict[str, str]]:
+        result = await self.session.execute(
+            select(AnthropicArticle.guid, AnthropicArticle.url, PageArchive.body_hash)
+            .join(PageArchive, PageArchive.url == AnthropicArticle.url)
+            .order_by(AnthropicArticle.published_at)
+        )
+        return [
+            {"guid": guid, "url": url, "body_hash": body_hash}
+            for guid, url, body_hash in result.all()
+        ]
+
+    async def _store_contents(
+        self, contents: Dict[str, str], inline: tuple = ()
+    ) -> Dict[str, Tuple[str, Optional[int]]]:
+        # Large text goes to the content store; rows keep a ref and a length.
+        # Status markers in `inline` are kept in the row as-is.
+        keys = [k for k, v in contents.items() if v not in inline]
+        refs = await self.content.put_many(contents[k] for k in keys)
+        stored = {k: (v, None) for k, v in contents.items() if v in inline}
+        for key, ref in zip(keys, refs):
+            stored[key] = (ref, len(contents[key]))
+        return stored
+
     async def update_anthropic_article_markdown(self, guid: str, markdown: str) -> bool:
+        stored = await self._store_contents({guid: markdown})
+        ref, length = stored[guid]
         result = await self.session.execute(
-            select(AnthropicArticle).filter_by(guid=guid)
+            update(AnthropicArticle)
+            .where(AnthropicArticle.guid == guid)
+            .values(
+                markdown=ref, markdown_length=length, content_hash=content_key(markdown)
+            )
         )
-        article = result.scalars().first()
-        if article:
-            article.markdown = markdown
-            await self.session.commit()
-            return True
-        return False
+        await self._sync_content_items(AnthropicArticle, [guid])
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def update_anthropic_articles_markdown(self, updates: Dict[str, str]) -> int:
+        if not updates:
+            return 0
+        stored = await self._store_contents(updates)
+        return await self.set_anthropic_articles_markdown(
+            {
+                guid: (content_key(updates[guid]), length)
+                for guid, (_, length) in stored.items()
+            }
+        )
+
+    # Points articles at markdown already in the content store:
+    # guid -> (markdown hash, markdown length).
+    async def set_anthropic_articles_markdown(
+        self, markdown: Dict[str, Tuple[str, int]]
+    ) -> int:
+        if not markdown:
+            return 0
+        await self.session.execute(
+            update(AnthropicArticle),
+            [
+                {
+                    "guid": guid,
+                    "markdown": REF_PREFIX + markdown_hash,
+                    "markdown_length": length,
+                    "content_hash": markdown_hash,
+                }
+                for guid, (markdown_hash, length) in markdown.items()
+            ],
+        )
+        await self._sync_content_items(AnthropicArticle, list(markdown))
+        await self.session.commit()
+        return len(markdown)
+
+    async def get_page_archive(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not urls:
+            return {}
+        result = await self.session.execute(
+            select(PageArchive).filter(PageArchive.url.in_(urls))
+        )
+        return {
+            page.url: {
+                "etag": page.etag,
+                "last_modified": page.last_modified,
+                "body_hash": page.body_hash,
+                "fetched_at": page.fetched_at,
+            }
+            for page in result.scalars().all()
+        }
+
+    # pages: url -> (html, etag, last_modified). Returns url -> body hash.
+    async def archive_pages(
+        self, pages: Dict[str, Tuple[str, Optional[str], Optional[str]]]
+    ) -> Dict[str, str]:
+        if not pages:
+            return {}
+        await self.content.put_many(html for html, _, _ in pages.values())
+        fetched_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_hash": content_key(html),
+                "fetched_at": fetched_at,
+            }
+            for url, (html, etag, last_modified) in pages.items()
+        ]
+        stmt = insert(PageArchive).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PageArchive.url],
+            set_={
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "body_hash": stmt.excluded.body_hash,
+                "fetched_at": stmt.excluded.fetched_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return {row["url"]: row["body_hash"] for row in rows}
+
+    async def get_archived_html(self, body_hashes: List[str]) -> Dict[str, str]:
+        pages = await self.content.get_many(REF_PREFIX + h for h in body_hashes)
+        return {ref[len(REF_PREFIX) :]: html for ref, html in pages.items()}
+
+    # Memoized conversions: body hash -> (markdown hash, markdown length).
+    async def get_conversions(
+        self, body_hashes: List[str], converter_version: str
+    ) -> Dict[str, Tuple[str, int]]:
+        if not body_hashes:
+            return {}
+        result = await self.session.execute(
+            select(PageConversion).filter(
+                PageConversion.body_hash.in_(body_hashes),
+                PageConversion.converter_version == converter_version,
+            )
+        )
+        return {
+            c.body_hash: (c.markdown_hash, c.markdown_length)
+            for c in result.scalars().all()
+        }
+
+    async def save_conversions(
+        self, markdown: Dict[str, str], converter_version: str
+    ) -> Dict[str, Tuple[str, int]]:
+        if not markdown:
+            return {}
+        await self.content.put_many(markdown.values())
+        conversions = {
+            body_hash: (content_key(text), len(text))
+            for body_hash, text in markdown.items()
+        }
+        stmt = insert(PageConversion).values(
+            [
+                {
+                    "body_hash": body_hash,
+                    "converter_version": converter_version,
+                    "markdown_hash": markdown_hash,
+                    "markdown_length": length,
+                }
+                for body_hash, (markdown_hash, length) in conversions.items()
+            ]
+        )
+        await self.session.execute(stmt.on_conflict_do_nothing())
+        await self.session.commit()
+        return conversions
 
     async def get_youtube_videos_without_transcript(
         self, limit: Optional[int] = None
     ) -> List[YouTubeVideo]:
-        stmt = select(YouTubeVideo).filter(YouTubeVideo.transcript.is_(None))
+        stmt = select(YouTubeVideo).filter(
+            YouTubeVideo.transcript.is_(None),
+            func.concat("youtube:", YouTubeVideo.video_id).notin_(
+                self._blocked_keys("transcript")
+            ),
+        )
         if limit:
             stmt = stmt.limit(limit)
 
@@ -201,86 +634,479 @@ class Repository:
     async def update_youtube_video_transcript(
         self, video_id: str, transcript: str
     ) -> bool:
+        stored = await self._store_contents(
+            {video_id: transcript}, inline=TRANSCRIPT_MARKERS
+        )
+        ref, length = stored[video_id]
         result = await self.session.execute(
-            select(YouTubeVideo).filter_by(video_id=video_id)
+            update(YouTubeVideo)
+            .where(YouTubeVideo.video_id == video_id)
+            .values(
+                transcript=ref,
+                transcript_length=length,
+                content_hash=None
+                if transcript in TRANSCRIPT_MARKERS
+                else content_key(transcript),
+            )
+        )
+        await self._sync_content_items(YouTubeVideo, [video_id])
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def update_youtube_videos_transcript(
+        self, updates: Dict[str, str], raw_transcripts: Optional[Dict[str, str]] = None
+    ) -> int:
+        if not updates:
+            return 0
+        raw_transcripts = raw_transcripts or {}
+        stored = await self._store_contents(updates, inline=TRANSCRIPT_MARKERS)
+        stored_raw = await self._store_contents(raw_transcripts)
+        rows = []
+        for video_id, (ref, length) in stored.items():
+            row = {
+                "video_id": video_id,
+                "transcript": ref,
+                "transcript_length": length,
+                "content_hash": None
+                if updates[video_id] in TRANSCRIPT_MARKERS
+                else content_key(updates[video_id]),
+            }
+            raw = raw_transcripts.get(video_id)
+            if raw:
+                row["raw_transcript"] = stored_raw[video_id][0]
+                row["transcript_compression"] = len(updates[video_id]) / len(raw)
+            rows.append(row)
+        await self.session.execute(update(YouTubeVideo), rows)
+        await self._sync_content_items(YouTubeVideo, list(updates))
+        await self.session.commit()
+        return len(updates)
+
+    # Leases and backoff are checked against the database clock, so workers
+    # on hosts with skewed clocks agree on when a lease or backoff expires.
+    @staticmethod
+    def _db_now():
+        return func.timezone("UTC", func.now(), type_=DateTime)
+
+    def _pending_conditions(self, skip_duplicates: bool, skip_fingerprinted: bool):
+        now = self._db_now()
+        conditions = [
+            ContentItem.status == "pending"
+            if skip_duplicates
+            else ContentItem.status.in_(("pending", "duplicate")),
+            ~exists().where(
+                StageFailure.stage == "digest",
+                StageFailure.item_key == ContentItem.key,
+                or_(
+                    StageFailure.dead_lettered_at.isnot(None),
+                    StageFailure.next_attempt_at > now,
+                ),
+            ),
+        ]
+        if skip_fingerprinted:
+            conditions.append(~exists().where(self._current_fingerprint()))
+        return conditions
+
+    # Only a fingerprint of the item's current content counts.
+    @staticmethod
+    def _current_fingerprint():
+        return and_(
+            ContentFingerprint.id == ContentItem.key,
+            ContentFingerprint.content_hash.is_not_distinct_from(
+                ContentItem.content_hash
+            ),
         )
-        video = result.scalars().first()
-        if video:
-            video.transcript = transcript
+
+    _ITEM_COLUMNS = (
+        ContentItem.id,
+        ContentItem.source_type,
+        ContentItem.source_id,
+        ContentItem.title,
+        ContentItem.url,
+        ContentItem.content,
+        ContentItem.published_at,
+        ContentItem.content_hash,
+    )
+
+    async def _item_dicts(self, rows, resolve_content: bool) -> List[Dict[str, Any]]:
+        contents = [row.content for row in rows]
+        if resolve_content:
+            contents = await self.content.resolve_many(contents)
+        return [
+            {
+                "type": row.source_type,
+                "id": row.source_id,
+                "item_id": row.id,
+                "title": row.title,
+                "url": row.url,
+                "content": content,
+                "published_at": row.published_at,
+                "content_hash": row.content_hash,
+            }
+            for row, content in zip(rows, contents)
+        ]
+
+    # Streams pending items page by page with keyset pagination, so callers
+    # can write digests between pages without holding a cursor open.
+    async def iter_articles_without_digest(
+        self,
+        limit: Optional[int] = None,
+        skip_duplicates: bool = True,
+        skip_fingerprinted: bool = False,
+        newest_first: bool = True,
+        page_size: int = 100,
+        resolve_content: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        pending = select(*self._ITEM_COLUMNS).filter(
+            *self._pending_conditions(skip_duplicates, skip_fingerprinted)
+        )
+        position = tuple_(ContentItem.published_at, ContentItem.id)
+        if newest_first:
+            order = (ContentItem.published_at.desc(), ContentItem.id.desc())
+        else:
+            order = (ContentItem.published_at, ContentItem.id)
+
+        last = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            stmt = pending.order_by(*order)
+            if last is not None:
+                stmt = stmt.filter(position < last if newest_first else position > last)
+            size = page_size if remaining is None else min(page_size, remaining)
+            result = await self.session.execute(stmt.limit(size))
+            rows = result.all()
+            items = await self._item_dicts(rows, resolve_content)
+            # End the read transaction before handing the page over, so no
+            # connection sits idle in a transaction while the caller works.
             await self.session.commit()
-            return True
-        return False
+            for item in items:
+                yield item
+            if len(rows) < size:
+                return
+            last = tuple_(rows[-1].published_at, rows[-1].id)
+            if remaining is not None:
+                remaining -= len(rows)
 
     async def get_articles_without_digest(
-        self, limit: Optional[int] = None
+        self, limit: Optional[int] = None, skip_duplicates: bool = True
     ) -> List[Dict[str, Any]]:
-        articles = []
-        seen_ids = set()
+        return [
+            article
+            async for article in self.iter_articles_without_digest(
+                limit=limit, skip_duplicates=skip_duplicates
+            )
+        ]
 
-        result = await self.session.execute(select(Digest))
-        digests = result.scalars().all()
-        for d in digests:
-            seen_ids.add(f"{d.article_type}:{d.article_id}")
+    # Claims up to `limit` pending items for a worker, newest first. Rows
+    # another worker is claiming right now are skipped rather than waited
+    # on, and a lease nobody released is taken over once it expires.
+    async def lease_pending_items(
+        self,
+        worker: str,
+        limit: int,
+        lease_seconds: float,
+        skip_duplicates: bool = True,
+    ) -> List[Dict[str, Any]]:
+        now = self._db_now()
+        claimable = (
+            select(ContentItem.id)
+            .filter(
+                *self._pending_conditions(skip_duplicates, False),
+                or_(
+                    ContentItem.lease_expires_at.is_(None),
+                    ContentItem.lease_expires_at < now,
+                ),
+            )
+            .order_by(ContentItem.published_at.desc(), ContentItem.id.desc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(ContentItem)
+            .where(ContentItem.id.in_(claimable.scalar_subquery()))
+            .values(
+                leased_by=worker,
+                lease_expires_at=now + literal(timedelta(seconds=lease_seconds), Interval),
+            )
+            .returning(*self._ITEM_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        rows = sorted(result.all(), key=lambda r: (r.published_at, r.id), reverse=True)
+        await self.session.commit()
+        return await self._item_dicts(rows, resolve_content=True)
 
+    # Pushes out the expiry of leases a worker still holds, so a slow batch
+    # isn't taken over while it is being processed.
+    async def renew_leases(
+        self, worker: str, item_ids: List[int], lease_seconds: float
+    ) -> int:
+        if not item_ids:
+            return 0
+        now = self._db_now()
         result = await self.session.execute(
-            select(YouTubeVideo).filter(
-                YouTubeVideo.transcript.isnot(None),
-                YouTubeVideo.transcript != "__UNAVAILABLE__",
+            update(ContentItem)
+            .where(ContentItem.id.in_(item_ids), ContentItem.leased_by == worker)
+            .values(
+                lease_expires_at=now + literal(timedelta(seconds=lease_seconds), Interval)
             )
+            .execution_options(synchronize_session=False)
         )
-        youtube_videos = result.scalars().all()
-        for video in youtube_videos:
-            key = f"youtube:{video.video_id}"
-            if key not in seen_ids:
-                articles.append(
-                    {
-                        "type": "youtube",
-                        "id": video.video_id,
-                        "title": video.title,
-                        "url": video.url,
-                        "content": video.transcript or video.description or "",
-                        "published_at": video.published_at,
-                    }
-                )
+        await self.session.commit()
+        return result.rowcount
 
-        result = await self.session.execute(select(OpenAIArticle))
-        openai_articles = result.scalars().all()
-        for article in openai_articles:
-            key = f"openai:{article.guid}"
-            if key not in seen_ids:
-                articles.append(
-                    {
-                        "type": "openai",
-                        "id": article.guid,
-                        "title": article.title,
-                        "url": article.url,
-                        "content": article.description or "",
-                        "published_at": article.published_at,
-                    }
+    async def release_leases(self, worker: str, item_ids: List[int]) -> None:
+        if not item_ids:
+            return
+        await self.session.execute(
+            update(ContentItem)
+            .where(ContentItem.id.in_(item_ids), ContentItem.leased_by == worker)
+            .values(leased_by=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    # Items still backing off after a failure, or dead-lettered, for a stage.
+    def _blocked_keys(self, stage: str):
+        now = self._db_now()
+        return select(StageFailure.item_key).filter(
+            StageFailure.stage == stage,
+            or_(
+                StageFailure.dead_lettered_at.isnot(None),
+                StageFailure.next_attempt_at > now,
+            ),
+        )
+
+    # errors: item key -> error message. Returns how many items were moved to
+    # the dead-letter state by this call.
+    async def record_failures(self, stage: str, errors: Dict[str, str]) -> int:
+        if not errors:
+            return 0
+        result = await self.session.execute(
+            select(StageFailure.item_key, StageFailure.attempts).filter(
+                StageFailure.stage == stage, StageFailure.item_key.in_(errors)
+            )
+        )
+        previous = dict(result.all())
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        rows = []
+        dead_lettered = 0
+        for key, error in errors.items():
+            attempts = previous.get(key, 0) + 1
+            row = {
+                "stage": stage,
+                "item_key": key,
+                "attempts": attempts,
+                "last_error": error[:2000],
+                "last_attempt_at": now,
+                "next_attempt_at": None,
+                "dead_lettered_at": None,
+            }
+            if attempts >= settings.retry_max_attempts:
+                row["dead_lettered_at"] = now
+                dead_lettered += 1
+            else:
+                delay = min(
+                    settings.retry_backoff_base * 2 ** (attempts - 1),
+                    settings.retry_backoff_max,
                 )
+                row["next_attempt_at"] = now + timedelta(seconds=delay)
+            rows.append(row)
+
+        stmt = insert(StageFailure).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StageFailure.stage, StageFailure.item_key],
+            set_={
+                "attempts": stmt.excluded.attempts,
+                "last_error": stmt.excluded.last_error,
+                "last_attempt_at": stmt.excluded.last_attempt_at,
+                "next_attempt_at": stmt.excluded.next_attempt_at,
+                "dead_lettered_at": stmt.excluded.dead_lettered_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return dead_lettered
 
+    async def clear_failures(self, stage: str, keys: List[str]) -> None:
+        if not keys:
+            return
+        await self.session.execute(
+            delete(StageFailure).filter(
+                StageFailure.stage == stage, StageFailure.item_key.in_(keys)
+            )
+        )
+        await self.session.commit()
+
+    async def get_fingerprints(self, since: datetime) -> List[ContentFingerprint]:
         result = await self.session.execute(
-            select(AnthropicArticle).filter(AnthropicArticle.markdown.isnot(None))
-        )
-        anthropic_articles = result.scalars().all()
-        for article in anthropic_articles:
-            key = f"anthropic:{article.guid}"
-            if key not in seen_ids:
-                articles.append(
-                    {
-                        "type": "anthropic",
-                        "id": article.guid,
-                        "title": article.title,
-                        "url": article.url,
-                        "content": article.markdown or article.description or "",
-                        "published_at": article.published_at,
-                    }
+            select(ContentFingerprint)
+            .filter(ContentFingerprint.published_at >= since)
+            .order_by(ContentFingerprint.published_at)
+        )
+        return result.scalars().all()
+
+    # Inserts fingerprints, replacing stale ones for items whose content
+    # changed. Items marked as duplicates of a replaced fingerprint lose their
+    # fingerprint too, so the next dedup run matches them again.
+    async def bulk_create_fingerprints(self, fingerprints: List[Dict[str, Any]]) -> int:
+        if not fingerprints:
+            return 0
+        stmt = insert(ContentFingerprint).values(fingerprints)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContentFingerprint.id],
+            set_={
+                "signature": stmt.excluded.signature,
+                "duplicate_of": stmt.excluded.duplicate_of,
+                "similarity": stmt.excluded.similarity,
+                "content_hash": stmt.excluded.content_hash,
+                "published_at": stmt.excluded.published_at,
+            },
+        ).returning(ContentFingerprint.id, literal_column("xmax = 0"))
+        result = await self.session.execute(stmt)
+        keys = [f["id"] for f in fingerprints]
+        replaced = [key for key, inserted in result.all() if not inserted]
+        released = [f["id"] for f in fingerprints if f["duplicate_of"] is None]
+        if replaced:
+            result = await self.session.execute(
+                delete(ContentFingerprint)
+                .filter(
+                    ContentFingerprint.duplicate_of.in_(replaced),
+                    ContentFingerprint.id.notin_(keys),
+                )
+                .returning(ContentFingerprint.id)
+            )
+            released.extend(result.scalars().all())
+        # Duplicates get a status of their own so digest selection never
+        # scans them; items that stopped being duplicates go back to pending.
+        if released:
+            await self.session.execute(
+                update(ContentItem)
+                .where(ContentItem.key.in_(released), ContentItem.status == "duplicate")
+                .values(
+                    status="pending",
+                    updated_at=datetime.now(timezone.utc).replace(tzinfo=None),
                 )
+            )
+            await self._mark_digested(ContentItem.key.in_(released))
+        await self._mark_duplicates(ContentItem.key.in_(keys))
+        await self.session.commit()
+        return len(fingerprints)
 
-        if limit:
-            articles = articles[:limit]
+    @staticmethod
+    def _digest_row(
+        article_type: str,
+        article_id: str,
+        url: str,
+        title: str,
+        summary: str,
+        published_at: Optional[datetime] = None,
+        content_hash: Optional[str] = None,
+        content_item_id: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        if published_at:
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            created_at = published_at
+        else:
+            created_at = datetime.now(timezone.utc)
+        return {
+            "id": f"{article_type}:{article_id}",
+            "article_type": article_type,
+            "article_id": article_id,
+            "url": url,
+            "title": title,
+            "summary": summary,
+            "content_hash": content_hash,
+            "content_item_id": content_item_id,
+            "created_at": created_at,
+        }
 
-        return articles
+    async def _content_item_ids(
+        self, items: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        if not items:
+            return {}
+        result = await self.session.execute(
+            select(ContentItem.source_type, ContentItem.source_id, ContentItem.id).filter(
+                tuple_(ContentItem.source_type, ContentItem.source_id).in_(items)
+            )
+        )
+        return {(t, i): item_id for t, i, item_id in result.all()}
+
+    # Items whose digest now matches their content leave the pending set.
+    async def _mark_digested(self, *filters) -> None:
+        await self.session.execute(
+            update(ContentItem)
+            .where(
+                *filters,
+                ContentItem.status == "pending",
+                Digest.content_item_id == ContentItem.id,
+                or_(
+                    Digest.content_hash.is_(None),
+                    Digest.content_hash == ContentItem.content_hash,
+                ),
+            )
+            .values(
+                status="digested",
+                updated_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        )
+
+    # Items whose current content is a near-duplicate of another story leave
+    # the pending set.
+    async def _mark_duplicates(self, *filters) -> None:
+        await self.session.execute(
+            update(ContentItem)
+            .where(
+                *filters,
+                ContentItem.status == "pending",
+                self._current_fingerprint(),
+                ContentFingerprint.duplicate_of.isnot(None),
+            )
+            .values(
+                status="duplicate",
+                updated_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            )
+        )
+
+    # Writes many digests in one statement. An existing digest is only
+    # rewritten when both it and the new one carry a hash and they differ,
+    # matching create_digest.
+    async def create_digests(self, digests: List[Dict[str, Any]]) -> int:
+        if not digests:
+            return 0
+        rows = [self._digest_row(**d) for d in digests]
+        item_ids = await self._content_item_ids(
+            [
+                (row["article_type"], row["article_id"])
+                for row in rows
+                if row["content_item_id"] is None
+            ]
+        )
+        for row in rows:
+            if row["content_item_id"] is None:
+                row["content_item_id"] = item_ids.get(
+                    (row["article_type"], row["article_id"])
+                )
+        stmt = insert(Digest).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Digest.id],
+            set_={
+                "title": stmt.excluded.title,
+                "summary": stmt.excluded.summary,
+                "content_hash": stmt.excluded.content_hash,
+                "content_item_id": stmt.excluded.content_item_id,
+            },
+            where=Digest.content_hash.isnot(None)
+            & stmt.excluded.content_hash.isnot(None)
+            & (Digest.content_hash != stmt.excluded.content_hash),
+        )
+        await self.session.execute(stmt)
+        item_ids = [row["content_item_id"] for row in rows if row["content_item_id"]]
+        if item_ids:
+            await self._mark_digested(ContentItem.id.in_(item_ids))
+        await self.session.commit()
+        return len(digests)
 
     async def create_digest(
         self,
@@ -290,30 +1116,43 @@ class Repository:
         title: str,
         summary: str,
         published_at: Optional[datetime] = None,
+        content_hash: Optional[str] = None,
     ) -> Optional[Digest]:
         digest_id = f"{article_type}:{article_id}"
+        item_ids = await self._content_item_ids([(article_type, article_id)])
+        item_id = item_ids.get((article_type, article_id))
         result = await self.session.execute(select(Digest).filter_by(id=digest_id))
         existing = result.scalars().first()
         if existing:
-            return None
-
-        if published_at:
-            if published_at.tzinfo is None:
-                published_at = published_at.replace(tzinfo=timezone.utc)
-            created_at = published_at
-        else:
-            created_at = datetime.now(timezone.utc)
+            if content_hash is None or existing.content_hash in (None, content_hash):
+                return None
+            # The source content changed since this digest was written.
+            existing.title = title
+            existing.summary = summary
+            existing.content_hash = content_hash
+            existing.content_item_id = item_id
+            await self.session.flush()
+            if item_id:
+                await self._mark_digested(ContentItem.id == item_id)
+            await self.session.commit()
+            return existing
 
         digest = Digest(
-            id=digest_id,
-            article_type=article_type,
-            article_id=article_id,
-            url=url,
-            title=title,
-            summary=summary,
-            created_at=created_at,
+            **self._digest_row(
+                article_type,
+                article_id,
+                url,
+                title,
+                summary,
+                published_at=published_at,
+                content_hash=content_hash,
+                content_item_id=item_id,
+            )
         )
         self.session.add(digest)
+        await self.session.flush()
+        if item_id:
+            await self._mark_digested(ContentItem.id == item_id)
         await self.session.commit()
         return digest
 
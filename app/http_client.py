@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional, Set
+
+import aiohttp
+import httpx
+import requests
+from httpx_aiohttp import AiohttpTransport
+from openai import AsyncOpenAI, DefaultAioHttpClient
+from requests.adapters import HTTPAdapter
+
+from app.settings import settings
+
+USER_AGENT = "Mozilla/5.0"
+
+
+class SharedSessionTransport(AiohttpTransport):
+    # Sends the OpenAI client's requests through HttpClient's aiohttp session,
+    # so they share its connection pool and reuse counters. The session is
+    # looked up per request because it is replaced on a new event loop, and
+    # HttpClient, not the OpenAI client, closes it.
+    def __init__(self, session: Callable[[], aiohttp.ClientSession]):
+        super().__init__()
+        self._session = session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.client = self._session()
+        return await super().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        self.client = None
+
+
+class HttpClient:
+    # One pooled client per protocol stack, created lazily and shared by every
+    # stage so connections to the same hosts are reused across the pipeline.
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._openai: Optional[AsyncOpenAI] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._closing: Set[asyncio.Task] = set()
+        self.stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        def count(key: str):
+            async def handler(session, context, params):
+                self.stats[key] += 1
+
+            return handler
+
+        trace.on_request_start.append(count("requests"))
+        trace.on_connection_create_end.append(count("connections_created"))
+        trace.on_connection_reuseconn.append(count("connections_reused"))
+        trace.on_dns_cache_hit.append(count("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(count("dns_cache_misses"))
+        return trace
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop it was created on; each asyncio.run
+        # gets a fresh one.
+        if self._session is not None and self._loop is not loop:
+            self._close_stale_session()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.http_pool_size,
+                limit_per_host=settings.http_pool_per_host,
+                ttl_dns_cache=settings.http_dns_cache_ttl,
+                keepalive_timeout=settings.http_keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=settings.http_total_timeout,
+                    connect=settings.http_connect_timeout,
+                    sock_read=settings.http_read_timeout,
+                ),
+                headers={"User-Agent": USER_AGENT},
+                trace_configs=[self._trace_config()],
+            )
+            self._loop = loop
+        return self._session
+
+    # The session from a previous loop is closed rather than dropped, which
+    # would leak its connector. Its loop has usually finished, in which case
+    # closing only marks it closed.
+    def _close_stale_session(self) -> None:
+        stale, self._session = self._session, None
+        if stale.closed:
+            return
+        task = asyncio.get_running_loop().create_task(stale.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closed_stale_session)
+
+    def _closed_stale_session(self, task: asyncio.Task) -> None:
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error closing stale HTTP session: {task.exception()}")
+
+    def openai(self) -> AsyncOpenAI:
+        if self._openai is None:
+            self._openai = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=DefaultAioHttpClient(
+                    transport=SharedSessionTransport(self.session)
+                ),
+            )
+        return self._openai
+
+    # requests.Session isn't thread-safe, so callers on worker threads get
+    # their own session; they all share one adapter and its connection pools.
+    def requests_session(self) -> requests.Session:
+        if self._adapter is None:
+            self._adapter = HTTPAdapter(
+                pool_connections=settings.http_pool_size,
+                pool_maxsize=settings.http_pool_per_host,
+            )
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        return session
+
+    def snapshot(self) -> Dict[str, Any]:
+        created = self.stats["connections_created"]
+        reused = self.stats["connections_reused"]
+        return {
+            **self.stats,
+            "reuse_ratio": round(reused / (created + reused), 3)
+            if created + reused
+            else None,
+        }
+
+    async def close(self) -> None:
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._openai is not None:
+            await self._openai.close()
+            self._openai = None
+        if self._adapter is not None:
+            self._adapter.close()
+            self._adapter = None
+
+
+http = HttpClient()
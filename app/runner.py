@@ -1,23 +1,29 @@
 import asyncio
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
-from pydantic import BaseModel
+from typing import Any, Dict, List
 
 from app.db.repo import Repository
-from app.db.connection import get_session
+from app.db.connection import pool_metrics, session_scope
+from app.http_client import http
 
 from app.scrapers import (
-    YoutubeScraper,
-    OpenAIScraper,
-    AnthropicScraper,
     YoutubeVideo,
     OpenAIArticle,
     AnthropicArticle,
+    RssArticle,
 )
+from app.scrapers.convert import shutdown_converter
+from app.scrapers.engine import ScrapeEngine
+from app.scrapers.fetch import FeedFetcher
+from app.scrapers.limits import ConcurrencyLimiter
+from app.scrapers.registry import load_sources
+from app.scrapers.policy import fetch_policy
 from app.settings import settings
 from app.services.process_anthropic import process_anthropic_articles
 from app.services.process_youtube import process_youtube_transcripts
+from app.services.process_dedup import process_duplicates
 from app.services.process_digest import process_digests
 from app.services.process_email import send_digest_email
 
@@ -29,40 +35,75 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class Feeds(BaseModel):
+@dataclass(slots=True)
+class Feeds:
     youtube: List[YoutubeVideo]
     openai: List[OpenAIArticle]
     anthropic: List[AnthropicArticle]
+    rss: List[RssArticle] = field(default_factory=list)
+    sources: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    engine: Dict[str, Any] = field(default_factory=dict)
+    feed_cache: Dict[str, int] = field(default_factory=dict)
+    new: Dict[str, List[str]] = field(default_factory=dict)
 
 
 async def run_scrapers(hours: int = 24):
-    youtube_scraper = YoutubeScraper()
-    openai_scraper = OpenAIScraper()
-    anthropic_scraper = AnthropicScraper()
+    sources = load_sources()
 
-    youtube_videos: List[YoutubeVideo] = []
-    for channel_id in settings.youtube_channels:
-        videos = await youtube_scraper.get_latest_videos(channel_id, hours=hours)
-        youtube_videos.extend(videos)
+    async with session_scope() as session:
+        repo = Repository(session=session)
+        validators = await repo.get_feed_validators([s.url for s in sources])
 
-    openai_articles: List[OpenAIArticle] = await openai_scraper.get_articles(
-        hours=hours
+    limiter = ConcurrencyLimiter(
+        settings.scrape_concurrency, settings.scrape_per_host_concurrency
     )
 
-    anthropic_articles: List[AnthropicArticle] = await anthropic_scraper.get_articles(
-        hours=hours
+    fetcher = FeedFetcher(http.session(), validators)
+    engine = ScrapeEngine(sources, fetcher, limiter)
+    items = await engine.run(hours=hours)
+
+    youtube_videos: List[YoutubeVideo] = items["youtube"]
+    openai_articles: List[OpenAIArticle] = items["openai"]
+    anthropic_articles: List[AnthropicArticle] = items["anthropic"]
+    rss_articles: List[RssArticle] = items["rss"]
+
+    # Only remember validators for feeds whose items made it into the DB,
+    # otherwise a failed run would skip those items on the next one.
+    failed_urls = engine.failed_urls
+
+    # Each storage is ingested on its own session so the inserts run
+    # concurrently.
+    async def ingest(create, records) -> List[str]:
+        async with session_scope() as session:
+            return await create(Repository(session=session), records)
+
+    new_youtube, new_openai, new_anthropic, new_rss = await asyncio.gather(
+        ingest(Repository.bulk_create_youtube_videos, youtube_videos),
+        ingest(Repository.bulk_create_openai_articles, openai_articles),
+        ingest(Repository.bulk_create_anthropic_articles, anthropic_articles),
+        ingest(Repository.bulk_create_rss_articles, rss_articles),
     )
 
-    async with get_session() as session:
+    async with session_scope() as session:
         repo = Repository(session=session)
-        await repo.bulk_create_youtube_videos(youtube_videos)
-        await repo.bulk_create_openai_articles(openai_articles)
-        await repo.bulk_create_anthropic_articles(anthropic_articles)
+        await repo.upsert_feed_validators(
+            [v for url, v in fetcher.updated.items() if url not in failed_urls]
+        )
 
     return Feeds(
         youtube=youtube_videos,
         openai=openai_articles,
         anthropic=anthropic_articles,
+        rss=rss_articles,
+        sources=engine.stats,
+        engine=engine.summary(),
+        feed_cache=fetcher.stats,
+        new={
+            "youtube": new_youtube,
+            "openai": new_openai,
+            "anthropic": new_anthropic,
+            "rss": new_rss,
+        },
     )
 
 
@@ -82,36 +123,49 @@ async def run_daily_pipeline(hours: int = 24, top_n: int = 10) -> dict:
     }
     
     try:
-        logger.info("\n[1/5] Scraping articles from sources...")
+        logger.info("\n[1/6] Scraping articles from sources...")
         scraping_results = await run_scrapers(hours=hours)
         results["scraping"] = {
             "youtube": len(scraping_results.youtube),
             "openai": len(scraping_results.openai),
-            "anthropic": len(scraping_results.anthropic)
+            "anthropic": len(scraping_results.anthropic),
+            "rss": len(scraping_results.rss),
+            "new": {k: len(v) for k, v in scraping_results.new.items()},
+            "failed_sources": scraping_results.engine["failed"],
+            "engine": scraping_results.engine,
+            "feed_cache": scraping_results.feed_cache,
+            "sources": scraping_results.sources,
         }
         logger.info(f"✓ Scraped {results['scraping']['youtube']} YouTube videos, "
                     f"{results['scraping']['openai']} OpenAI articles, "
-                    f"{results['scraping']['anthropic']} Anthropic articles")
+                    f"{results['scraping']['anthropic']} Anthropic articles, "
+                    f"{results['scraping']['rss']} RSS articles")
         
-        logger.info("\n[2/5] Processing Anthropic markdown...")
+        logger.info("\n[2/6] Processing Anthropic markdown...")
         anthropic_result = await process_anthropic_articles()
         results["processing"]["anthropic"] = anthropic_result
         logger.info(f"✓ Processed {anthropic_result['processed']} Anthropic articles "
                     f"({anthropic_result['failed']} failed)")
         
-        logger.info("\n[3/5] Processing YouTube transcripts...")
+        logger.info("\n[3/6] Processing YouTube transcripts...")
         youtube_result = await process_youtube_transcripts()
         results["processing"]["youtube"] = youtube_result
         logger.info(f"✓ Processed {youtube_result['processed']} transcripts "
                     f"({youtube_result['unavailable']} unavailable)")
         
-        logger.info("\n[4/5] Creating digests for articles...")
+        logger.info("\n[4/6] Detecting near-duplicate articles...")
+        dedup_result = await process_duplicates()
+        results["processing"]["dedup"] = dedup_result
+        logger.info(f"✓ Fingerprinted {dedup_result['fingerprinted']} articles "
+                    f"({dedup_result['duplicates']} duplicates)")
+        
+        logger.info("\n[5/6] Creating digests for articles...")
         digest_result = await process_digests()
         results["digests"] = digest_result
         logger.info(f"✓ Created {digest_result['processed']} digests "
                     f"({digest_result['failed']} failed out of {digest_result['total']} total)")
         
-        logger.info("\n[5/5] Generating and sending email digest...")
+        logger.info("\n[6/6] Generating and sending email digest...")
         email_result = await send_digest_email(hours=hours, top_n=top_n)
         results["email"] = email_result
         
@@ -124,6 +178,12 @@ async def run_daily_pipeline(hours: int = 24, top_n: int = 10) -> dict:
     except Exception as e:
         logger.error(f"Pipeline failed with error: {e}", exc_info=True)
         results["error"] = str(e)
+    finally:
+        shutdown_converter()
+        results["fetch_policy"] = fetch_policy.snapshot()
+        results["http"] = http.snapshot()
+        results["db_pool"] = pool_metrics.snapshot()
+        await http.close()
     
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
@@ -137,6 +197,9 @@ async def run_daily_pipeline(hours: int = 24, top_n: int = 10) -> dict:
     logger.info(f"Scraped: {results['scraping']}")
     logger.info(f"Processed: {results['processing']}")
     logger.info(f"Digests: {results['digests']}")
+    logger.info(f"Fetch policy: {results['fetch_policy']}")
+    logger.info(f"HTTP connections: {results['http']}")
+    logger.info(f"DB pool: {results['db_pool']}")
     logger.info(f"Email: {'Sent' if results['success'] else 'Failed'}")
     logger.info("=" * 60)
     
@@ -2,6 +2,7 @@ from .base import BaseScraper, Article
 from .anthropic import AnthropicScraper, AnthropicArticle
 from .openai import OpenAIScraper, OpenAIArticle
 from .youtube import YoutubeScraper, YoutubeVideo
+from .rss import RssScraper, RssArticle
 
 __all__ = [
     "BaseScraper",
@@ -12,4 +13,6 @@ __all__ = [
     "OpenAIArticle",
     "YoutubeScraper",
     "YoutubeVideo",
+    "RssScraper",
+    "RssArticle",
 ]
@@ -1,15 +1,21 @@
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
 import aiohttp
-from html_to_markdown import convert
+from app.http_client import http
 from app.scrapers.base import Article, BaseScraper
+from app.scrapers.convert import html_to_markdown
+from app.scrapers.policy import fetch_policy
 
 
+@dataclass(slots=True)
 class AnthropicArticle(Article):
     pass
 
 
 class AnthropicScraper(BaseScraper):
+    article_model = AnthropicArticle
+
     @property
     def rss_urls(self) -> List[str]:
         return [
@@ -18,23 +24,48 @@ class AnthropicScraper(BaseScraper):
             "https://raw.githubusercontent.com/Olshansk/rss-feeds/main/feeds/feed_anthropic_engineering.xml",
         ]
 
-    async def get_articles(self, hours: int = 24) -> List[AnthropicArticle]:
-        articles = await super().get_articles(hours)
-        return [AnthropicArticle(**article.model_dump()) for article in articles]
-
-    async def url_to_markdown(self, url: str) -> str:
+    async def url_to_markdown(
+        self, url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[str]:
+        session = session or http.session()
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30
-                ) as response:
-                    response.raise_for_status()
-                    html = await response.text()
-                    markdown = convert(html)
-                    return markdown
-        except Exception:
+            html, _, _ = await self.fetch_page(url, session)
+            return await html_to_markdown(html)
+        except Exception as e:
+            print(f"Error converting {url} to markdown: {e}")
             return None
 
+    # Returns (html, etag, last_modified); html is None when the archived copy
+    # described by `validator` is still current.
+    async def fetch_page(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        validator: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        headers = {"User-Agent": "Mozilla/5.0"}
+        validator = validator or {}
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return await fetch_policy.call(
+            url, lambda: self._fetch_html(url, session, headers)
+        )
+
+    async def _fetch_html(
+        self, url: str, session: aiohttp.ClientSession, headers: Dict[str, str]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, None, None
+            response.raise_for_status()
+            return (
+                await response.text(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
 
 if __name__ == "__main__":
     import asyncio
@@ -47,5 +78,6 @@ if __name__ == "__main__":
             # Test async url_to_markdown
             markdown = await anthropic.url_to_markdown(articles[1].url)
             print(markdown[:500] + "..." if markdown else "None")
+        await http.close()
 
     asyncio.run(main())
@@ -1,15 +1,20 @@
 import asyncio
-import feedparser
 from datetime import timedelta
 from datetime import timezone
-from typing import List
+from typing import List, Type
 from abc import ABC, abstractmethod
-from pydantic import BaseModel
+from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
+from app.scrapers.feed import read_feed
+from app.scrapers.fetch import FeedFetcher
 
-class Article(BaseModel):
+
+# Scraped items are plain slotted records: they are built once per feed entry
+# and handed straight to the repository, so they skip pydantic validation.
+@dataclass(slots=True)
+class Article:
     title: str
     description: str
     url: str
@@ -19,47 +24,51 @@ class Article(BaseModel):
 
 
 class BaseScraper(ABC):
+    article_model: Type[Article] = Article
+
+    def __init__(self, fetcher: Optional[FeedFetcher] = None):
+        self.fetcher = fetcher
+
     @property
     @abstractmethod
     def rss_urls(self) -> List[str]:
         pass
 
-    async def get_articles(self, hours: int = 24) -> List[Article]:
-        now = datetime.now(timezone.utc)
-        cut_off_time = now - timedelta(hours=hours)
+    async def get_feed_articles(self, rss_url: str, hours: int = 24) -> List[Article]:
+        cut_off_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         articles: List[Article] = []
-        seen_guids = set()
 
-        for rss_url in self.rss_urls:
-            feed = await asyncio.to_thread(feedparser.parse, rss_url)
-            if not feed.entries:
+        for entry in await read_feed(rss_url, cut_off_time, self.fetcher):
+            if entry.published_at is None or entry.published_at < cut_off_time:
                 continue
 
-            for entry in feed.entries:
-                published_parsed = getattr(entry, "published_parsed", None)
-                if not published_parsed:
-                    continue
+            articles.append(
+                self.article_model(
+                    title=entry.title,
+                    description=entry.description,
+                    url=entry.link,
+                    guid=entry.guid,
+                    published_at=entry.published_at,
+                    category=entry.category,
+                )
+            )
+
+        return articles
 
-                published_time = datetime(*published_parsed[:6], tzinfo=timezone.utc)
-                if published_time < cut_off_time:
-                    continue
+    async def get_articles(self, hours: int = 24) -> List[Article]:
+        feeds = await asyncio.gather(
+            *(self.get_feed_articles(rss_url, hours) for rss_url in self.rss_urls)
+        )
+        return dedupe_articles(article for feed in feeds for article in feed)
 
-                guid = entry.get("id", entry.get("link", ""))
-                if guid in seen_guids:
-                    continue
 
-                seen_guids.add(guid)
-                articles.append(
-                    Article(
-                        title=entry.get("title", ""),
-                        description=entry.get("description", ""),
-                        url=entry.get("link", ""),
-                        guid=guid,
-                        published_at=published_time,
-                        category=entry.get("tags", [{}])[0].get("term")
-                        if entry.get("tags")
-                        else None,
-                    )
-                )
+def dedupe_articles(articles) -> List[Article]:
+    seen_guids = set()
+    unique: List[Article] = []
+    for article in articles:
+        if article.guid in seen_guids:
+            continue
+        seen_guids.add(article.guid)
+        unique.append(article)
+    return unique
 
-        return articles
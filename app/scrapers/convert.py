@@ -0,0 +1,51 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from html_to_markdown import convert
+
+from app.scrapers.extract import extract_main_content
+from app.settings import settings
+
+# Bump whenever conversion output changes so memoized markdown is redone.
+CONVERTER_VERSION = "2"
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def converter_version() -> str:
+    if settings.markdown_extract_main_content:
+        return f"{CONVERTER_VERSION}+extract"
+    return CONVERTER_VERSION
+
+
+def get_converter() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.markdown_process_workers or os.cpu_count()
+        )
+    return _executor
+
+
+def shutdown_converter() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _convert(html: str, extract: bool) -> str:
+    if extract:
+        html = extract_main_content(html)
+    return convert(html)
+
+
+async def html_to_markdown(html: str) -> str:
+    if len(html) > settings.markdown_max_html_chars:
+        html = html[: settings.markdown_max_html_chars]
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_converter(), _convert, html, settings.markdown_extract_main_content
+    )
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from app.scrapers.anthropic import AnthropicScraper
+from app.scrapers.base import BaseScraper, dedupe_articles
+from app.scrapers.fetch import FeedFetcher
+from app.scrapers.limits import ConcurrencyLimiter
+from app.scrapers.openai import OpenAIScraper
+from app.scrapers.rss import RssScraper
+from app.scrapers.youtube import YoutubeScraper
+from app.settings import SourceConfig, settings
+
+logger = logging.getLogger(__name__)
+
+STORAGE_SCRAPERS = {
+    "openai": OpenAIScraper,
+    "anthropic": AnthropicScraper,
+}
+
+
+class ScrapeEngine:
+    def __init__(
+        self,
+        sources: List[SourceConfig],
+        fetcher: FeedFetcher,
+        limiter: ConcurrencyLimiter,
+    ):
+        self.sources = sources
+        self.fetcher = fetcher
+        self.limiter = limiter
+        self.youtube = YoutubeScraper(fetcher=fetcher)
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.seconds = 0.0
+
+    def _scraper(self, source: SourceConfig) -> BaseScraper:
+        if source.storage in STORAGE_SCRAPERS:
+            return STORAGE_SCRAPERS[source.storage](fetcher=self.fetcher)
+        return RssScraper(source.name, [source.url], fetcher=self.fetcher)
+
+    def is_due(self, source: SourceConfig) -> bool:
+        if source.poll_interval_minutes <= 0:
+            return True
+        validator = self.fetcher.validators.get(source.url) or {}
+        checked_at = validator.get("checked_at")
+        if checked_at is None:
+            return True
+        return datetime.utcnow() - checked_at >= timedelta(
+            minutes=source.poll_interval_minutes
+        )
+
+    async def _scrape(self, source: SourceConfig, hours: int) -> list:
+        if source.type == "youtube":
+            return await self.youtube.get_latest_videos(source.channel_id, hours=hours)
+        return await self._scraper(source).get_feed_articles(source.url, hours=hours)
+
+    async def _run_source(self, source: SourceConfig, hours: int) -> list:
+        start = time.perf_counter()
+        stat: Dict[str, Any] = {
+            "url": source.url,
+            "type": source.type,
+            "storage": source.storage,
+        }
+        self.stats[source.name] = stat
+        try:
+            async with self.limiter.slot(source.url):
+                fetch_start = time.perf_counter()
+                async with asyncio.timeout(settings.scrape_source_timeout):
+                    items = await self._scrape(source, hours)
+            seconds = time.perf_counter() - fetch_start
+            stat.update(
+                items=len(items),
+                seconds=round(seconds, 3),
+                waited_seconds=round(fetch_start - start, 3),
+                items_per_second=round(len(items) / seconds, 2) if seconds else 0.0,
+            )
+            return items
+        except Exception as e:
+            stat.update(
+                items=0,
+                seconds=round(time.perf_counter() - start, 3),
+                error=f"{type(e).__name__}: {e}",
+            )
+            logger.warning(f"✗ Source {source.name} failed: {stat['error']}")
+            return []
+
+    async def run(self, hours: int = 24) -> Dict[str, list]:
+        start = time.perf_counter()
+        due: List[SourceConfig] = []
+        for source in self.sources:
+            if self.is_due(source):
+                due.append(source)
+            else:
+                self.stats[source.name] = {"url": source.url, "skipped": True}
+
+        results = await asyncio.gather(*(self._run_source(s, hours) for s in due))
+
+        by_storage: Dict[str, list] = {
+            "youtube": [],
+            "openai": [],
+            "anthropic": [],
+            "rss": [],
+        }
+        for source, items in zip(due, results):
+            by_storage[source.storage].extend(items)
+        for storage in ("openai", "anthropic", "rss"):
+            by_storage[storage] = dedupe_articles(by_storage[storage])
+
+        self.seconds = time.perf_counter() - start
+        return by_storage
+
+    @property
+    def failed_urls(self) -> set:
+        return {stat["url"] for stat in self.stats.values() if "error" in stat}
+
+    def summary(self) -> Dict[str, Any]:
+        items = sum(stat.get("items", 0) for stat in self.stats.values())
+        return {
+            "sources": len(self.sources),
+            "skipped": sum(1 for stat in self.stats.values() if stat.get("skipped")),
+            "failed": len(self.failed_urls),
+            "items": items,
+            "seconds": round(self.seconds, 3),
+            "items_per_second": round(items / self.seconds, 2) if self.seconds else 0.0,
+        }
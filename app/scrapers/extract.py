@@ -0,0 +1,197 @@
+import html
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import List, Optional, Union
+
+SKIP_TAGS = {
+    "head", "script", "style", "noscript", "template", "nav", "footer", "aside",
+    "form", "iframe", "svg", "button", "dialog", "select",
+}
+# <header> is only chrome outside the article; inside it holds the title.
+PAGE_ONLY_SKIP_TAGS = {"header"}
+CANDIDATE_TAGS = {"article", "main"}
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "source", "track", "wbr",
+}
+KEEP_ATTRS = {"href", "src", "alt", "title", "colspan", "rowspan"}
+BOILERPLATE = re.compile(
+    r"cookie|consent|banner|newsletter|subscribe|related|share|social|"
+    r"breadcrumb|sidebar|footer|navbar|menu|promo|skip-link|signup|popup|modal",
+    re.IGNORECASE,
+)
+# A nested candidate (an <article> inside <main>) wins if it keeps at least
+# this share of the outer candidate's score.
+NESTED_SHARE = 0.6
+# Boilerplate-looking class names only lower a candidate's score.
+BOILERPLATE_PENALTY = 0.2
+# Inside the chosen content, a boilerplate-looking block is only dropped when
+# it holds less than this share of the content's text; a wrapper around the
+# article body is kept.
+BOILERPLATE_MAX_SHARE = 0.3
+# Extractions with less text than this fall back to the full page.
+MIN_TEXT_LENGTH = 200
+
+
+@dataclass(eq=False)
+class _Node:
+    tag: str
+    attrs: str = ""
+    markers: str = ""
+    role: str = ""
+    parent: Optional["_Node"] = None
+    children: List[Union["_Node", str]] = field(default_factory=list)
+    text_length: int = 0
+    link_length: int = 0
+
+    @property
+    def boilerplate(self) -> bool:
+        return bool(self.markers) and bool(BOILERPLATE.search(self.markers))
+
+    @property
+    def score(self) -> float:
+        # Text density: link-heavy blocks (menus, related lists) score low.
+        score = self.text_length - self.link_length
+        return score * BOILERPLATE_PENALTY if self.boilerplate else score
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node("")
+        self.stack: List[_Node] = [self.root]
+        self.nodes: List[_Node] = []
+        self.skip_tag: Optional[str] = None
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.skip_tag is not None:
+            if tag == self.skip_tag:
+                self.skip_depth += 1
+            return
+        if tag in SKIP_TAGS:
+            self.skip_tag = tag
+            self.skip_depth = 1
+            return
+
+        node = _Node(
+            tag,
+            attrs="".join(
+                f' {k}="{html.escape(v)}"' for k, v in attrs if k in KEEP_ATTRS and v
+            ),
+            markers=" ".join(
+                v for k, v in attrs if k in ("class", "id", "role") and v
+            ),
+            role=dict(attrs).get("role") or "",
+            parent=self.stack[-1],
+        )
+        node.parent.children.append(node)
+        self.nodes.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self.skip_tag is not None:
+            if tag == self.skip_tag:
+                self.skip_depth -= 1
+                if self.skip_depth == 0:
+                    self.skip_tag = None
+            return
+        # Close the nearest open element with this tag, along with anything
+        # left unclosed inside it; stray end tags are ignored.
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        if self.skip_tag is None:
+            self.stack[-1].children.append(data)
+
+
+def _measure(node: _Node, in_link: bool = False) -> None:
+    in_link = in_link or node.tag == "a"
+    for child in node.children:
+        if isinstance(child, str):
+            length = len(child.strip())
+            node.text_length += length
+            node.link_length += length if in_link else 0
+        else:
+            _measure(child, in_link)
+            node.text_length += child.text_length
+            node.link_length += child.link_length
+
+
+def _depth(node: _Node) -> int:
+    depth = 0
+    while node.parent is not None:
+        node = node.parent
+        depth += 1
+    return depth
+
+
+def _choose(builder: _TreeBuilder) -> _Node:
+    candidates = [
+        n
+        for n in builder.nodes
+        if (n.tag in CANDIDATE_TAGS or n.role == "main") and n.text_length
+    ]
+    if not candidates:
+        body = next((n for n in builder.nodes if n.tag == "body"), None)
+        return body or builder.root
+
+    candidates.sort(key=lambda n: n.score, reverse=True)
+    best = candidates[0]
+    for candidate in candidates[1:]:
+        if (
+            _depth(candidate) > _depth(best)
+            and candidate.score >= NESTED_SHARE * best.score
+        ):
+            best = candidate
+    return best
+
+
+def _render(node: _Node, content: _Node, in_candidate: bool, parts: List[str]) -> int:
+    in_candidate = in_candidate or node.tag in CANDIDATE_TAGS or node.role == "main"
+    text_length = 0
+    for child in node.children:
+        if isinstance(child, str):
+            parts.append(html.escape(child, quote=False))
+            text_length += len(child.strip())
+            continue
+        if child.tag in PAGE_ONLY_SKIP_TAGS and not in_candidate:
+            continue
+        if (
+            child.boilerplate
+            and child.text_length < BOILERPLATE_MAX_SHARE * content.text_length
+        ):
+            continue
+        parts.append(f"<{child.tag}{child.attrs}>")
+        if child.tag not in VOID_TAGS:
+            text_length += _render(child, content, in_candidate, parts)
+            parts.append(f"</{child.tag}>")
+    return text_length
+
+
+def extract_main_content(page: str) -> str:
+    builder = _TreeBuilder()
+    builder.feed(page)
+    builder.close()
+    _measure(builder.root)
+
+    content = _choose(builder)
+    # The chosen element and its ancestors are never pruned, only blocks
+    # inside it.
+    parts = [f"<{content.tag}{content.attrs}>"] if content.tag else []
+    text_length = _render(content, content, False, parts)
+    if content.tag:
+        parts.append(f"</{content.tag}>")
+    if text_length < MIN_TEXT_LENGTH:
+        return page
+    return "".join(parts)
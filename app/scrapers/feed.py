@@ -0,0 +1,171 @@
+import asyncio
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional, Set
+
+import feedparser
+
+from app.http_client import http
+from app.scrapers.fetch import FeedFetcher
+
+ENTRY_TAGS = {"item", "entry"}
+CHUNK_SIZE = 16 * 1024
+# Feeds are newest-first, but tolerate a few out-of-order entries before
+# deciding everything after the cutoff is old.
+MAX_STALE_ENTRIES = 3
+
+
+@dataclass(slots=True)
+class FeedEntry:
+    title: str
+    link: str
+    guid: str
+    description: str
+    published_at: Optional[datetime]
+    category: Optional[str] = None
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _entry_from_element(element: ET.Element) -> FeedEntry:
+    fields = {}
+    link = None
+    category = None
+    for child in element.iter():
+        if child is element:
+            continue
+        tag = _local(child.tag)
+        if tag == "link":
+            rel = child.get("rel", "alternate")
+            href = child.get("href")
+            if href and rel == "alternate" and link is None:
+                link = href
+            elif child.text and link is None:
+                link = child.text.strip()
+        elif tag == "category" and category is None:
+            category = child.get("term") or (child.text or "").strip() or None
+        elif tag not in fields and child.text:
+            fields[tag] = child.text.strip()
+
+    link = link or ""
+    published = (
+        fields.get("pubDate")
+        or fields.get("published")
+        or fields.get("date")
+        or fields.get("updated")
+    )
+    return FeedEntry(
+        title=fields.get("title", ""),
+        link=link,
+        guid=fields.get("guid") or fields.get("id") or link,
+        description=fields.get("description")
+        or fields.get("summary")
+        or fields.get("content")
+        or "",
+        published_at=_parse_date(published),
+        category=category,
+    )
+
+
+def _stream_entries(body: bytes, cutoff: datetime) -> Iterator[FeedEntry]:
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: List[ET.Element] = []
+    stale = 0
+    for offset in range(0, len(body), CHUNK_SIZE):
+        parser.feed(body[offset : offset + CHUNK_SIZE])
+        for event, element in parser.read_events():
+            if event == "start":
+                stack.append(element)
+                continue
+            stack.pop()
+            if _local(element.tag) not in ENTRY_TAGS:
+                continue
+
+            entry = _entry_from_element(element)
+            # Drop the parsed subtree so memory stays flat on large feeds.
+            if stack:
+                stack[-1].remove(element)
+
+            if entry.published_at is not None and entry.published_at < cutoff:
+                stale += 1
+                if stale >= MAX_STALE_ENTRIES:
+                    return
+                continue
+            stale = 0
+            yield entry
+    parser.close()
+
+
+def _entry_from_feedparser(entry) -> FeedEntry:
+    published_parsed = getattr(entry, "published_parsed", None)
+    return FeedEntry(
+        title=entry.get("title", ""),
+        link=entry.get("link", ""),
+        guid=entry.get("id", entry.get("link", "")),
+        description=entry.get("description", ""),
+        published_at=datetime(*published_parsed[:6], tzinfo=timezone.utc)
+        if published_parsed
+        else None,
+        category=entry.get("tags", [{}])[0].get("term") if entry.get("tags") else None,
+    )
+
+
+def _feedparser_entries(source, cutoff: datetime, skip: Set[str]) -> List[FeedEntry]:
+    feed = feedparser.parse(source)
+    entries = []
+    for raw in feed.entries:
+        entry = _entry_from_feedparser(raw)
+        if entry.guid in skip:
+            continue
+        if entry.published_at is not None and entry.published_at < cutoff:
+            continue
+        entries.append(entry)
+    return entries
+
+
+def parse_entries(body: bytes, cutoff: datetime) -> List[FeedEntry]:
+    entries: List[FeedEntry] = []
+    try:
+        for entry in _stream_entries(body, cutoff):
+            entries.append(entry)
+    except ET.ParseError:
+        # Malformed XML (undeclared HTML entities, broken encodings...) is
+        # left to feedparser, which is far more forgiving.
+        entries.extend(
+            _feedparser_entries(body, cutoff, {entry.guid for entry in entries})
+        )
+    return entries
+
+
+async def read_feed(
+    url: str, cutoff: datetime, fetcher: Optional[FeedFetcher] = None
+) -> List[FeedEntry]:
+    if fetcher is None:
+        # No validators to revalidate against, but still use the shared pool
+        # rather than feedparser's own urllib fetch.
+        fetcher = FeedFetcher(http.session())
+
+    body = await fetcher.fetch(url)
+    if body is None:
+        return []
+    return await asyncio.to_thread(parse_entries, body, cutoff)
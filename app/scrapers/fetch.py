@@ -0,0 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from app.scrapers.policy import FetchPolicy, fetch_policy
+
+FEED_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+class FeedFetcher:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        validators: Optional[Dict[str, Dict[str, Any]]] = None,
+        policy: FetchPolicy = fetch_policy,
+    ):
+        self.session = session
+        self.policy = policy
+        self.validators = validators or {}
+        self.updated: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"fetched": 0, "not_modified": 0, "unchanged": 0}
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        headers = dict(FEED_HEADERS)
+        validator = self.validators.get(url) or {}
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
+    def _record(self, url: str, **fields) -> None:
+        validator = {**(self.validators.get(url) or {}), **fields}
+        validator["url"] = url
+        validator["checked_at"] = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.validators[url] = validator
+        self.updated[url] = validator
+
+    async def _get(self, url: str):
+        async with self.session.get(
+            url, headers=self._conditional_headers(url)
+        ) as response:
+            if response.status == 304:
+                return None, None, None
+            response.raise_for_status()
+            return (
+                await response.read(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+    # Returns None when the feed has not changed since the last run.
+    async def fetch(self, url: str) -> Optional[bytes]:
+        body, etag, last_modified = await self.policy.call(
+            url, lambda: self._get(url)
+        )
+        if body is None:
+            self.stats["not_modified"] += 1
+            self._record(url)
+            return None
+
+        body_hash = hashlib.sha256(body).hexdigest()
+        previous = self.validators.get(url) or {}
+        self._record(
+            url, etag=etag, last_modified=last_modified, body_hash=body_hash
+        )
+        if previous.get("body_hash") == body_hash:
+            self.stats["unchanged"] += 1
+            return None
+
+        self.stats["fetched"] += 1
+        return body
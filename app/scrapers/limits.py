@@ -0,0 +1,31 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlparse
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class ConcurrencyLimiter:
+    def __init__(self, global_limit: int, per_host_limit: int):
+        self._global = asyncio.Semaphore(global_limit)
+        self._per_host_limit = per_host_limit
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = host_of(url)
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._per_host_limit)
+            self._hosts[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        # Take the host slot first so requests queued behind a busy host
+        # don't hold global slots other hosts could be using.
+        async with self._host_semaphore(url):
+            async with self._global:
+                yield
@@ -1,20 +1,20 @@
+from dataclasses import dataclass
 from typing import List
 from .base import BaseScraper, Article
 
 
+@dataclass(slots=True)
 class OpenAIArticle(Article):
     pass
 
 
 class OpenAIScraper(BaseScraper):
+    article_model = OpenAIArticle
+
     @property
     def rss_urls(self) -> List[str]:
         return ["https://openai.com/news/rss.xml"]
 
-    async def get_articles(self, hours: int = 24) -> List[OpenAIArticle]:
-        articles = await super().get_articles(hours)
-        return [OpenAIArticle(**article.model_dump()) for article in articles]
-
 
 if __name__ == "__main__":
     import asyncio
@@ -0,0 +1,213 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import aiohttp
+
+from app.scrapers.limits import host_of
+from app.settings import settings
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, host: str):
+        super().__init__(f"Circuit open for {host}")
+        self.host = host
+
+
+def is_retryable_http_error(error: BaseException) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRYABLE_STATUS
+    return isinstance(
+        error,
+        (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError),
+    )
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            # A recovering host gets a single probe; everyone else fails fast
+            # until it reports back.
+            if self.probe_in_flight:
+                return False
+            self.probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+
+    # The probe ended without a result (cancelled); let the next caller probe.
+    def abandon(self) -> None:
+        self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.probe_in_flight = False
+        self.consecutive_failures += 1
+        if (
+            self.state == self.HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class HostPolicy:
+    def __init__(self, bucket: TokenBucket, breaker: CircuitBreaker):
+        self.bucket = bucket
+        self.breaker = breaker
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.short_circuited = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.breaker.state,
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "short_circuited": self.short_circuited,
+        }
+
+
+class FetchPolicy:
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        failure_threshold: int,
+        reset_timeout: float,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts: Dict[str, HostPolicy] = {}
+
+    @classmethod
+    def from_settings(cls) -> "FetchPolicy":
+        return cls(
+            rate=settings.http_rate_per_host,
+            burst=settings.http_burst_per_host,
+            max_retries=settings.http_max_retries,
+            backoff_base=settings.http_backoff_base,
+            backoff_max=settings.http_backoff_max,
+            failure_threshold=settings.http_breaker_threshold,
+            reset_timeout=settings.http_breaker_reset,
+        )
+
+    def host(self, host: str) -> HostPolicy:
+        policy = self._hosts.get(host)
+        if policy is None:
+            policy = HostPolicy(
+                TokenBucket(self.rate, self.burst),
+                CircuitBreaker(self.failure_threshold, self.reset_timeout),
+            )
+            self._hosts[host] = policy
+        return policy
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: sleep anywhere up to the exponential ceiling.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def call(
+        self,
+        url: str,
+        fn: Callable[[], Awaitable[T]],
+        retryable: Optional[Callable[[BaseException], bool]] = None,
+        key: Optional[str] = None,
+    ) -> T:
+        retryable = retryable or is_retryable_http_error
+        # Callers that reach one host through several routes (proxies) pass
+        # a key so each route gets its own rate limit and breaker.
+        host = key or host_of(url)
+        policy = self.host(host)
+
+        attempt = 0
+        while True:
+            if not policy.breaker.allow():
+                policy.short_circuited += 1
+                raise CircuitOpenError(host)
+            probe = policy.breaker.state == CircuitBreaker.HALF_OPEN
+
+            try:
+                await policy.bucket.acquire()
+                policy.requests += 1
+                result = await fn()
+            except asyncio.CancelledError:
+                if probe:
+                    policy.breaker.abandon()
+                raise
+            except Exception as e:
+                if not retryable(e):
+                    # The host answered; the request itself was bad.
+                    policy.breaker.record_success()
+                    raise
+                policy.failures += 1
+                policy.breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise
+                policy.retries += 1
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            policy.breaker.record_success()
+            return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {host: policy.snapshot() for host, policy in self._hosts.items()}
+
+
+fetch_policy = FetchPolicy.from_settings()
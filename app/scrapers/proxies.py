@@ -0,0 +1,141 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from youtube_transcript_api.proxies import (
+    GenericProxyConfig,
+    ProxyConfig,
+    WebshareProxyConfig,
+)
+
+from app.settings import settings
+
+
+class NoHealthyProxyError(Exception):
+    pass
+
+
+class ProxyState:
+    def __init__(self, name: str, config: Optional[ProxyConfig], max_in_flight: int):
+        self.name = name
+        self.config = config
+        self.max_in_flight = max_in_flight
+        self.score = 1.0
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self.consecutive_blocks = 0
+        self.successes = 0
+        self.failures = 0
+        self.blocks = 0
+
+    def available(self, now: float) -> bool:
+        return self.cooldown_until <= now and self.in_flight < self.max_in_flight
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "score": round(self.score, 3),
+            "in_flight": self.in_flight,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+            "successes": self.successes,
+            "failures": self.failures,
+            "blocks": self.blocks,
+        }
+
+
+class ProxyPool:
+    # Transcript fetches run on worker threads, so the pool uses a
+    # threading.Condition rather than asyncio primitives.
+    def __init__(
+        self,
+        proxies: List[ProxyState],
+        cooldown: float,
+        max_cooldown: float,
+        acquire_timeout: float,
+    ):
+        self.proxies = proxies
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.acquire_timeout = acquire_timeout
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_settings(cls) -> "ProxyPool":
+        proxies = [
+            ProxyState(
+                urlparse(url).hostname or url,
+                GenericProxyConfig(http_url=url, https_url=url),
+                settings.youtube_proxy_max_in_flight,
+            )
+            for url in settings.youtube_proxies
+        ]
+        if not proxies and settings.youtube_proxy_username and settings.youtube_proxy_password:
+            # Webshare rotates exit IPs behind one endpoint.
+            proxies.append(
+                ProxyState(
+                    "webshare",
+                    WebshareProxyConfig(
+                        proxy_username=settings.youtube_proxy_username,
+                        proxy_password=settings.youtube_proxy_password,
+                    ),
+                    settings.transcript_concurrency,
+                )
+            )
+        if not proxies:
+            proxies.append(ProxyState("direct", None, settings.transcript_concurrency))
+        return cls(
+            proxies,
+            cooldown=settings.youtube_proxy_cooldown,
+            max_cooldown=settings.youtube_proxy_max_cooldown,
+            acquire_timeout=settings.youtube_proxy_acquire_timeout,
+        )
+
+    @property
+    def capacity(self) -> int:
+        return sum(proxy.max_in_flight for proxy in self.proxies)
+
+    def acquire(self) -> ProxyState:
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [p for p in self.proxies if p.available(now)]
+                if candidates:
+                    # Prefer healthy proxies, spreading load across equals.
+                    proxy = max(candidates, key=lambda p: p.score / (1 + p.in_flight))
+                    proxy.in_flight += 1
+                    return proxy
+
+                if now >= deadline:
+                    raise NoHealthyProxyError("Timed out waiting for a free proxy")
+                cooling = [p.cooldown_until for p in self.proxies if p.cooldown_until > now]
+                if len(cooling) == len(self.proxies) and min(cooling) > deadline:
+                    raise NoHealthyProxyError("All proxies are cooling down")
+                # Wake on a release, or as soon as the next cooldown ends.
+                self._condition.wait(min([deadline, *cooling]) - now)
+
+    def release(
+        self, proxy: ProxyState, success: bool = True, blocked: bool = False
+    ) -> None:
+        with self._condition:
+            proxy.in_flight -= 1
+            if blocked:
+                proxy.blocks += 1
+                proxy.consecutive_blocks += 1
+                proxy.score *= 0.5
+                proxy.cooldown_until = time.monotonic() + min(
+                    self.max_cooldown,
+                    self.cooldown * 2 ** (proxy.consecutive_blocks - 1),
+                )
+            elif success:
+                proxy.successes += 1
+                proxy.consecutive_blocks = 0
+                proxy.score = proxy.score * 0.8 + 0.2
+            else:
+                proxy.failures += 1
+                proxy.score *= 0.8
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._condition:
+            return {proxy.name: proxy.snapshot() for proxy in self.proxies}
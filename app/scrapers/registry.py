@@ -0,0 +1,52 @@
+from typing import List
+
+from app.scrapers.anthropic import AnthropicScraper
+from app.scrapers.openai import OpenAIScraper
+from app.scrapers.youtube import YoutubeScraper
+from app.settings import SourceConfig, settings
+
+
+def builtin_sources() -> List[SourceConfig]:
+    sources = [
+        SourceConfig(
+            name=f"youtube:{channel_id}",
+            type="youtube",
+            url=YoutubeScraper.rss_url(channel_id),
+            channel_id=channel_id,
+            storage="youtube",
+        )
+        for channel_id in settings.youtube_channels
+    ]
+    sources += [
+        SourceConfig(name=f"openai:{url}", url=url, storage="openai")
+        for url in OpenAIScraper().rss_urls
+    ]
+    sources += [
+        SourceConfig(name=f"anthropic:{url}", url=url, storage="anthropic")
+        for url in AnthropicScraper().rss_urls
+    ]
+    return sources
+
+
+def load_sources() -> List[SourceConfig]:
+    sources: List[SourceConfig] = []
+    seen_urls = set()
+    for source in [*builtin_sources(), *settings.sources]:
+        if source.type == "youtube":
+            if not source.channel_id:
+                raise ValueError(f"YouTube source {source.name} has no channel_id")
+            source = source.model_copy(
+                update={
+                    "url": YoutubeScraper.rss_url(source.channel_id),
+                    "storage": "youtube",
+                }
+            )
+        elif source.storage == "youtube":
+            raise ValueError(f"RSS source {source.name} can't use youtube storage")
+        if not source.url:
+            raise ValueError(f"Source {source.name} has no feed url")
+        if not source.enabled or source.url in seen_urls:
+            continue
+        seen_urls.add(source.url)
+        sources.append(source)
+    return sources
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from app.scrapers.base import Article, BaseScraper
+from app.scrapers.fetch import FeedFetcher
+
+
+@dataclass(slots=True)
+class RssArticle(Article):
+    source: str = ""
+
+
+class RssScraper(BaseScraper):
+    article_model = RssArticle
+
+    def __init__(
+        self, source: str, urls: List[str], fetcher: Optional[FeedFetcher] = None
+    ):
+        super().__init__(fetcher)
+        self.source = source
+        self.urls = urls
+
+    @property
+    def rss_urls(self) -> List[str]:
+        return self.urls
+
+    async def get_feed_articles(self, rss_url: str, hours: int = 24) -> List[RssArticle]:
+        articles = await super().get_feed_articles(rss_url, hours)
+        for article in articles:
+            article.source = self.source
+        return articles
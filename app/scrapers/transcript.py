@@ -0,0 +1,59 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, List
+
+NON_SPEECH = re.compile(
+    r"\[[^\]]*\]|\((?:music|applause|laughter|laughs|inaudible|silence)[^)]*\)|[♪♫]+",
+    re.IGNORECASE,
+)
+# Only standalone lowercase hesitation tokens; "HMM" or "Ah" may be content.
+FILLER = re.compile(r"(?<![\w'-])(?:u+m+|u+h+|e+r+m+)(?![\w'-]),?\s*")
+# A word said three or more times in a row is a stutter; "had had" is English.
+REPEATED_WORD = re.compile(r"\b(\w+)(?:\s+\1\b){2,}", re.IGNORECASE)
+SPACE_BEFORE_PUNCT = re.compile(r"\s+([,.!?;:])")
+SENTENCE_END = re.compile(r"([.!?])\s+(\w)")
+WHITESPACE = re.compile(r"\s+")
+# Overlap between consecutive auto-caption snippets is short; cap the search.
+MAX_OVERLAP_WORDS = 20
+# Shorter boundary matches are usually just a repeated word, not an overlap.
+MIN_OVERLAP_WORDS = 3
+
+
+@dataclass
+class NormalizedTranscript:
+    raw: str
+    text: str
+
+    @property
+    def compression(self) -> float:
+        return len(self.text) / len(self.raw) if self.raw else 1.0
+
+
+def _overlap(previous: List[str], current: List[str]) -> int:
+    limit = min(len(previous), len(current), MAX_OVERLAP_WORDS)
+    for size in range(limit, MIN_OVERLAP_WORDS - 1, -1):
+        if [w.lower() for w in previous[-size:]] == [w.lower() for w in current[:size]]:
+            return size
+    return 0
+
+
+def _dedupe_snippets(snippets: Iterable[str]) -> List[str]:
+    words: List[str] = []
+    for snippet in snippets:
+        current = snippet.split()
+        if not current:
+            continue
+        words.extend(current[_overlap(words, current) :])
+    return words
+
+
+def normalize_transcript(snippets: List[str]) -> NormalizedTranscript:
+    raw = " ".join(snippets)
+    cleaned = [FILLER.sub("", NON_SPEECH.sub(" ", s)) for s in snippets]
+    text = " ".join(_dedupe_snippets(cleaned))
+    text = REPEATED_WORD.sub(r"\1", text)
+    text = SPACE_BEFORE_PUNCT.sub(r"\1", WHITESPACE.sub(" ", text)).strip()
+    text = SENTENCE_END.sub(lambda m: f"{m.group(1)} {m.group(2).upper()}", text)
+    if text:
+        text = text[0].upper() + text[1:]
+    return NormalizedTranscript(raw=raw, text=text)
@@ -1,19 +1,43 @@
-from youtube_transcript_api.proxies import WebshareProxyConfig
 from youtube_transcript_api import (
     YouTubeTranscriptApi,
     TranscriptsDisabled,
     NoTranscriptFound,
+    RequestBlocked,
+    YouTubeRequestFailed,
 )
 import asyncio
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timezone
-import feedparser
 from datetime import datetime, timedelta
-from pydantic import BaseModel
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
+from app.http_client import http
+from app.scrapers.feed import read_feed
+from app.scrapers.fetch import FeedFetcher
+from app.scrapers.limits import host_of
+from app.scrapers.policy import CircuitOpenError, fetch_policy
+from app.scrapers.proxies import ProxyPool, ProxyState
+from app.scrapers.transcript import NormalizedTranscript, normalize_transcript
 from app.settings import settings
 
 
-class YoutubeVideo(BaseModel):
+# Blocks are not retried through the same proxy: the pool cools the proxy
+# down and fetch_transcript moves on to another one.
+def is_retryable_transcript_error(error: BaseException) -> bool:
+    return isinstance(
+        error,
+        (
+            YouTubeRequestFailed,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ),
+    )
+
+
+@dataclass(slots=True)
+class YoutubeVideo:
     video_id: str
     title: str
     published_at: datetime
@@ -24,20 +48,46 @@ class YoutubeVideo(BaseModel):
 
 
 class YoutubeScraper:
-    def __init__(self):
-        proxy_config = None
+    def __init__(
+        self, fetcher: Optional[FeedFetcher] = None, proxies: Optional[ProxyPool] = None
+    ):
+        self.fetcher = fetcher
+        self.proxies = proxies or ProxyPool.from_settings()
+        # Fetches wait for a proxy slot on the event loop. Waiting in
+        # ProxyPool.acquire would tie up executor threads that the fetches
+        # holding proxies need in order to finish and release them.
+        self._proxy_slots = asyncio.Semaphore(self.proxies.capacity)
+
+        # YouTubeTranscriptApi wraps a requests.Session, which isn't safe to
+        # share across threads, so each worker thread gets its own client
+        # per proxy.
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(settings.transcript_concurrency, self.proxies.capacity),
+            thread_name_prefix="transcripts",
+        )
 
-        if settings.youtube_proxy_username and settings.youtube_proxy_password:
-            proxy_config = WebshareProxyConfig(
-                proxy_username=settings.youtube_proxy_username,
-                proxy_password=settings.youtube_proxy_password,
+    def _transcript_api(self, proxy: ProxyState) -> YouTubeTranscriptApi:
+        apis = getattr(self._local, "apis", None)
+        if apis is None:
+            apis = self._local.apis = {}
+        if proxy.name not in apis:
+            apis[proxy.name] = YouTubeTranscriptApi(
+                proxy_config=proxy.config, http_client=http.requests_session()
             )
+        return apis[proxy.name]
 
-        self.transcript_api = YouTubeTranscriptApi(proxy_config=proxy_config)
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
-    def _get_rss_url(self, channel_id: str) -> str:
+    @staticmethod
+    def rss_url(channel_id: str) -> str:
         return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
 
+    @staticmethod
+    def watch_url(video_id: str) -> str:
+        return f"https://www.youtube.com/watch?v={video_id}"
+
     def _extract_video_id(self, url: str) -> str:
         if "youtube.com/watch/?v=" in url:
             return url.split("v=")[1].split("&")[0]
@@ -50,25 +100,19 @@ class YoutubeScraper:
     async def get_latest_videos(
         self, channel_id: str, hours: int = 24
     ) -> List[YoutubeVideo]:
-        # feedparser is blocking, run in thread
-        feed = await asyncio.to_thread(feedparser.parse, self._get_rss_url(channel_id))
-        if not feed.entries:
-            return []
-
         cut_off_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         videos: List[YoutubeVideo] = []
 
-        for entry in feed.entries:
-            if "/shorts/" in entry.link:
+        for entry in await read_feed(self.rss_url(channel_id), cut_off_time, self.fetcher):
+            if "/shorts/" in entry.link or entry.published_at is None:
                 continue
 
-            video_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            if video_date > cut_off_time:
+            if entry.published_at > cut_off_time:
                 videos.append(
                     YoutubeVideo(
                         video_id=self._extract_video_id(entry.link),
                         title=entry.title,
-                        published_at=video_date,
+                        published_at=entry.published_at,
                         link=entry.link,
                         description=entry.description,
                         channel_id=channel_id,
@@ -77,27 +121,87 @@ class YoutubeScraper:
 
         return videos
 
-    async def get_transcript(self, video_id: str) -> Optional[str]:
+    def _fetch_transcript(self, proxy: ProxyState, video_id: str) -> NormalizedTranscript:
+        transcript = self._transcript_api(proxy).fetch(video_id)
+        return normalize_transcript([snippet.text for snippet in transcript.snippets])
+
+    async def _fetch_via(self, proxy: ProxyState, video_id: str) -> NormalizedTranscript:
+        loop = asyncio.get_running_loop()
+        url = self.watch_url(video_id)
         try:
-            transcript = await asyncio.to_thread(self.transcript_api.fetch, video_id)
-            return " ".join([snippet.text for snippet in transcript.snippets])
+            transcript = await fetch_policy.call(
+                url,
+                lambda: loop.run_in_executor(
+                    self._executor, self._fetch_transcript, proxy, video_id
+                ),
+                retryable=is_retryable_transcript_error,
+                key=f"{host_of(url)} via {proxy.name}",
+            )
+        except RequestBlocked:
+            self.proxies.release(proxy, blocked=True)
+            raise
         except (TranscriptsDisabled, NoTranscriptFound):
-            return None
+            # YouTube answered, so the proxy itself is fine.
+            self.proxies.release(proxy)
+            raise
+        except BaseException:
+            self.proxies.release(proxy, success=False)
+            raise
+        self.proxies.release(proxy)
+        return transcript
+
+    # Returns None when the video has no transcript; any other failure is
+    # raised so callers can tell it apart and retry later.
+    async def fetch_transcript(self, video_id: str) -> Optional[NormalizedTranscript]:
+        loop = asyncio.get_running_loop()
+        # Each proxy has its own breaker and token bucket, so a blocked or
+        # broken proxy is swapped out instead of shutting off YouTube for
+        # the whole pool. NoHealthyProxyError from acquire is not retried.
+        for attempt in range(settings.http_max_retries + 1):
+            async with self._proxy_slots:
+                proxy = await loop.run_in_executor(self._executor, self.proxies.acquire)
+                try:
+                    return await self._fetch_via(proxy, video_id)
+                except (TranscriptsDisabled, NoTranscriptFound):
+                    return None
+                except (RequestBlocked, CircuitOpenError):
+                    if attempt >= settings.http_max_retries:
+                        raise
+
+    async def get_transcript(self, video_id: str) -> Optional[NormalizedTranscript]:
+        try:
+            return await self.fetch_transcript(video_id)
         except Exception as e:
             print(f"Error getting transcript for {video_id}: {e}")
             return None
 
+    # Yields (video_id, result) where result is the transcript, None when the
+    # video has none, or the exception that a fetch failed with.
+    async def get_transcripts(
+        self, video_ids: Iterable[str]
+    ) -> AsyncIterator[Tuple[str, Union[NormalizedTranscript, None, Exception]]]:
+        async def fetch(video_id: str):
+            try:
+                return video_id, await self.fetch_transcript(video_id)
+            except Exception as e:
+                return video_id, e
+
+        # The proxy slots bound how many fetches actually run at once; results
+        # are yielded as they complete so callers can write them in batches.
+        for next_result in asyncio.as_completed([fetch(v) for v in video_ids]):
+            yield await next_result
+
     async def scrape_channel(
         self, channel_id: str, hours: int = 24
     ) -> List[YoutubeVideo]:
         videos = await self.get_latest_videos(channel_id, hours)
 
-        tasks = [self._get_transcript(video.video_id) for video in videos]
+        tasks = [self.get_transcript(video.video_id) for video in videos]
 
         transcripts = await asyncio.gather(*tasks)
 
         for video, transcript in zip(videos, transcripts):
-            video.transcript = transcript
+            video.transcript = transcript.text if transcript else None
 
         return videos
 
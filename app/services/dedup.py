@@ -0,0 +1,76 @@
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+MERSENNE_PRIME = (1 << 61) - 1
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str, size: int = 3) -> Set[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest())
+
+
+def minhash(text: str, shingle_size: int = 3) -> Optional[List[int]]:
+    hashes = [_hash(s) for s in shingles(text, shingle_size)]
+    if not hashes:
+        return None
+    return [
+        min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    ]
+
+
+def similarity(left: List[int], right: List[int]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / NUM_PERM
+
+
+class LSHIndex:
+    def __init__(self):
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[str]] = defaultdict(list)
+        self._signatures: Dict[str, List[int]] = {}
+
+    def _bands(self, signature: List[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(BANDS):
+            yield band, tuple(signature[band * ROWS : (band + 1) * ROWS])
+
+    def add(self, key: str, signature: List[int]) -> None:
+        self._signatures[key] = signature
+        for bucket in self._bands(signature):
+            self._buckets[bucket].append(key)
+
+    def remove(self, key: str) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for bucket in self._bands(signature):
+            self._buckets[bucket].remove(key)
+
+    def best_match(
+        self, signature: List[int], threshold: float
+    ) -> Optional[Tuple[str, float]]:
+        candidates = {
+            key for bucket in self._bands(signature) for key in self._buckets.get(bucket, ())
+        }
+        best = None
+        for key in candidates:
+            score = similarity(signature, self._signatures[key])
+            if score >= threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
@@ -1,42 +1,171 @@
 import asyncio
+from typing import Dict, List, Optional, Tuple
+from app.db.batch import BatchWriter
 from app.db.repo import Repository
-from app.db.connection import get_session
+from app.db.connection import session_scope
+from app.http_client import http
 from app.scrapers.anthropic import AnthropicScraper
+from app.scrapers.convert import converter_version, html_to_markdown, shutdown_converter
+from app.settings import settings
 
 
-async def process_anthropic_articles():
+# Converts archived pages, reusing memoized markdown where the same body was
+# already converted by this converter version. Returns body hash ->
+# (markdown hash, markdown length) for every page that converted. No session
+# is held while the converter runs.
+async def convert_pages(body_hashes: List[str]) -> Dict[str, Tuple[str, int]]:
+    version = converter_version()
+    body_hashes = list(set(body_hashes))
+    async with session_scope() as session:
+        repo = Repository(session=session)
+        conversions = await repo.get_conversions(body_hashes, version)
+        missing = [h for h in body_hashes if h not in conversions]
+        if not missing:
+            return conversions
+        pages = await repo.get_archived_html(missing)
+
+    semaphore = asyncio.Semaphore(settings.markdown_concurrency)
+
+    async def convert(body_hash: str, html: str):
+        async with semaphore:
+            try:
+                return body_hash, await html_to_markdown(html)
+            except Exception as e:
+                print(f"Error converting page {body_hash[:12]} to markdown: {e}")
+                return body_hash, None
+
+    results = await asyncio.gather(*[convert(h, html) for h, html in pages.items()])
+    markdown = {body_hash: text for body_hash, text in results if text}
+    async with session_scope() as session:
+        repo = Repository(session=session)
+        conversions.update(await repo.save_conversions(markdown, version))
+    return conversions
+
+
+async def process_anthropic_articles(limit: Optional[int] = None):
     scraper = AnthropicScraper()
 
     processed = 0
     failed = 0
+    not_modified = 0
+    dead_lettered = 0
     articles = []
 
-    async with get_session() as session:
+    async with session_scope() as session:
         repo = Repository(session=session)
-        articles = await repo.get_anthropic_articles_without_markdown()
-        for article in articles:
-            markdown = await scraper.url_to_markdown(article.url)
+        articles = await repo.get_anthropic_articles_without_markdown(limit=limit)
+        archive = await repo.get_page_archive([a.url for a in articles])
+
+    semaphore = asyncio.Semaphore(settings.markdown_concurrency)
+
+    async def fetch(article):
+        async with semaphore:
             try:
-                if markdown:
-                    if not await repo.update_anthropic_article_markdown(
-                        article.guid, markdown
-                    ):
-                        raise Exception("Failed to update article markdown")
-                    processed += 1
-                else:
-                    failed += 1
+                return article, await scraper.fetch_page(
+                    article.url, http.session(), archive.get(article.url)
+                )
             except Exception as e:
-                failed += 1
-                print(f"Error processing article {article.guid}: {e}")
-                continue
+                print(f"Error fetching {article.url}: {e}")
+                return article, e
+
+    # batch: guid -> (article, fetched page or the exception it failed with)
+    async def enrich(batch: Dict[str, Tuple]):
+        nonlocal processed, failed, not_modified, dead_lettered
+        fetched = {}
+        body_hashes = {}
+        errors = {}
+        for article, page in batch.values():
+            if isinstance(page, Exception):
+                errors[f"anthropic:{article.guid}"] = repr(page)
+            elif page[0] is None:
+                not_modified += 1
+                body_hashes[article.guid] = archive[article.url]["body_hash"]
+            else:
+                fetched[article.url] = page
+        try:
+            async with session_scope() as session:
+                archived = await Repository(session=session).archive_pages(fetched)
+            for article, _ in batch.values():
+                if article.url in archived:
+                    body_hashes[article.guid] = archived[article.url]
+
+            conversions = await convert_pages(list(body_hashes.values()))
+            markdown = {
+                guid: conversions[body_hash]
+                for guid, body_hash in body_hashes.items()
+                if body_hash in conversions
+            }
+            async with session_scope() as session:
+                repo = Repository(session=session)
+                processed += await repo.set_anthropic_articles_markdown(markdown)
+                await repo.clear_failures(
+                    "markdown", [f"anthropic:{guid}" for guid in markdown]
+                )
+            for guid in body_hashes.keys() - markdown.keys():
+                errors[f"anthropic:{guid}"] = "markdown conversion failed"
+        except Exception as e:
+            print(f"Error saving markdown for {len(batch)} articles: {e}")
+            # Recorded like any other failure so they back off and are
+            # eventually dead-lettered instead of retrying every run.
+            for article, _ in batch.values():
+                errors.setdefault(f"anthropic:{article.guid}", repr(e))
+        failed += len(errors)
+        async with session_scope() as session:
+            dead_lettered += await Repository(session=session).record_failures(
+                "markdown", errors
+            )
+
+    async with BatchWriter(enrich, settings.markdown_batch_size) as writer:
+        for next_result in asyncio.as_completed([fetch(a) for a in articles]):
+            article, page = await next_result
+            await writer.add(article.guid, (article, page))
+
+    return {
+        "total": len(articles),
+        "processed": processed,
+        "failed": failed,
+        "not_modified": not_modified,
+        "dead_lettered": dead_lettered,
+    }
+
+
+# Rebuilds markdown for every archived article from the stored HTML, without
+# touching the network. Used after a converter or extractor change.
+async def reenrich_anthropic_articles() -> dict:
+    processed = 0
+    failed = 0
+
+    async with session_scope() as session:
+        articles = await Repository(session=session).get_archived_anthropic_articles()
+
+    for start in range(0, len(articles), settings.markdown_batch_size):
+        batch = articles[start : start + settings.markdown_batch_size]
+        conversions = await convert_pages([a["body_hash"] for a in batch])
+        markdown = {
+            a["guid"]: conversions[a["body_hash"]]
+            for a in batch
+            if a["body_hash"] in conversions
+        }
+        failed += len(batch) - len(markdown)
+        async with session_scope() as session:
+            repo = Repository(session=session)
+            processed += await repo.set_anthropic_articles_markdown(markdown)
 
     return {"total": len(articles), "processed": processed, "failed": failed}
 
 
 if __name__ == "__main__":
+    import sys
 
     async def main():
-        result = await process_anthropic_articles()
+        try:
+            if len(sys.argv) > 1 and sys.argv[1] == "offline":
+                result = await reenrich_anthropic_articles()
+            else:
+                result = await process_anthropic_articles()
+        finally:
+            shutdown_converter()
+            await http.close()
         print(f"Total articles: {result['total']}")
         print(f"Processed: {result['processed']}")
         print(f"Failed: {result['failed']}")
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from app.db.connection import session_scope
+from app.db.content import REF_PREFIX
+from app.db.models import AnthropicArticle, YouTubeVideo
+from app.db.repo import Repository, TRANSCRIPT_MARKERS
+from app.settings import settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def train_content_dictionary() -> dict:
+    async with session_scope() as session:
+        repo = Repository(session=session)
+        result = await session.execute(
+            select(YouTubeVideo.transcript)
+            .filter(
+                YouTubeVideo.transcript.isnot(None),
+                YouTubeVideo.transcript.notin_(TRANSCRIPT_MARKERS),
+            )
+            .order_by(YouTubeVideo.created_at.desc())
+            .limit(settings.content_dict_samples)
+        )
+        samples = await repo.content.resolve_many(result.scalars().all())
+        if not samples:
+            logger.warning("No transcripts available to train a dictionary")
+            return {"dictionary_id": None, "samples": 0}
+
+        dict_id = await repo.content.train_dictionary(samples)
+        await session.commit()
+
+    logger.info(f"Trained content dictionary {dict_id} on {len(samples)} transcripts")
+    return {"dictionary_id": dict_id, "samples": len(samples)}
+
+
+# Moves transcripts and markdown still stored inline into the content store.
+async def compact_content(batch_size: int = 200) -> dict:
+    moved = {"youtube": 0, "anthropic": 0}
+
+    async with session_scope() as session:
+        repo = Repository(session=session)
+
+        while True:
+            result = await session.execute(
+                select(YouTubeVideo.video_id, YouTubeVideo.transcript)
+                .filter(
+                    YouTubeVideo.transcript.isnot(None),
+                    YouTubeVideo.transcript.notin_(TRANSCRIPT_MARKERS),
+                    YouTubeVideo.transcript.notlike(REF_PREFIX + "%"),
+                )
+                .limit(batch_size)
+            )
+            rows = dict(result.all())
+            if not rows:
+                break
+            moved["youtube"] += await repo.update_youtube_videos_transcript(rows)
+
+        while True:
+            result = await session.execute(
+                select(AnthropicArticle.guid, AnthropicArticle.markdown)
+                .filter(
+                    AnthropicArticle.markdown.isnot(None),
+                    AnthropicArticle.markdown.notlike(REF_PREFIX + "%"),
+                )
+                .limit(batch_size)
+            )
+            rows = dict(result.all())
+            if not rows:
+                break
+            moved["anthropic"] += await repo.update_anthropic_articles_markdown(rows)
+
+    return moved
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def main():
+        if len(sys.argv) > 1 and sys.argv[1] == "train":
+            result = await train_content_dictionary()
+            print(f"Dictionary: {result['dictionary_id']} ({result['samples']} samples)")
+        else:
+            result = await compact_content()
+            print(f"Moved transcripts: {result['youtube']}")
+            print(f"Moved markdown: {result['anthropic']}")
+
+    asyncio.run(main())
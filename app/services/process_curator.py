@@ -4,7 +4,8 @@ import asyncio
 from app.agents.curator import CuratorAgent
 from app.profiles.user_profile import USER_PROFILE
 from app.db.repo import Repository
-from app.db.connection import get_session
+from app.db.connection import session_scope
+from app.http_client import http
 
 
 logging.basicConfig(
@@ -18,59 +19,62 @@ logger = logging.getLogger(__name__)
 async def curate_digests(hours: int = 24) -> dict:
     curator = CuratorAgent(USER_PROFILE)
 
-    async with get_session() as session:
-        repo = Repository(session=session)
-
-        digests = await repo.get_recent_digests(hours=hours)
-        total = len(digests)
-
-        if total == 0:
-            logger.warning(f"No digests found from the last {hours} hours")
-            return {"total": 0, "ranked": 0}
-
-        logger.info(f"Curating {total} digests from the last {hours} hours")
-        logger.info(
-            f"User profile: {USER_PROFILE['name']} - {USER_PROFILE['background']}"
-        )
-
-        ranked_articles = await curator.rank_digests(digests)
-
-        if not ranked_articles:
-            logger.error("Failed to rank digests")
-            return {"total": total, "ranked": 0}
-
-        logger.info(f"Successfully ranked {len(ranked_articles)} articles")
-        logger.info("\n=== Top 10 Ranked Articles ===")
-
-        for article in ranked_articles[:10]:
-            digest = next((d for d in digests if d["id"] == article.digest_id), None)
-            if digest:
-                logger.info(
-                    f"\nRank {article.rank} | Score: {article.relevance_score:.1f}/10.0"
-                )
-                logger.info(f"Title: {digest['title']}")
-                logger.info(f"Type: {digest['article_type']}")
-                logger.info(f"Reasoning: {article.reasoning}")
-
-        return {
-            "total": total,
-            "ranked": len(ranked_articles),
-            "articles": [
-                {
-                    "digest_id": a.digest_id,
-                    "rank": a.rank,
-                    "relevance_score": a.relevance_score,
-                    "reasoning": a.reasoning,
-                }
-                for a in ranked_articles
-            ],
-        }
+    # The ranking and writing calls wait on the LLM, so the session is only
+    # held for the read.
+    async with session_scope() as session:
+        digests = await Repository(session=session).get_recent_digests(hours=hours)
+    total = len(digests)
+
+    if total == 0:
+        logger.warning(f"No digests found from the last {hours} hours")
+        return {"total": 0, "ranked": 0}
+
+    logger.info(f"Curating {total} digests from the last {hours} hours")
+    logger.info(
+        f"User profile: {USER_PROFILE['name']} - {USER_PROFILE['background']}"
+    )
+
+    ranked_articles = await curator.rank_digests(digests)
+
+    if not ranked_articles:
+        logger.error("Failed to rank digests")
+        return {"total": total, "ranked": 0}
+
+    logger.info(f"Successfully ranked {len(ranked_articles)} articles")
+    logger.info("\n=== Top 10 Ranked Articles ===")
+
+    for article in ranked_articles[:10]:
+        digest = next((d for d in digests if d["id"] == article.digest_id), None)
+        if digest:
+            logger.info(
+                f"\nRank {article.rank} | Score: {article.relevance_score:.1f}/10.0"
+            )
+            logger.info(f"Title: {digest['title']}")
+            logger.info(f"Type: {digest['article_type']}")
+            logger.info(f"Reasoning: {article.reasoning}")
+
+    return {
+        "total": total,
+        "ranked": len(ranked_articles),
+        "articles": [
+            {
+                "digest_id": a.digest_id,
+                "rank": a.rank,
+                "relevance_score": a.relevance_score,
+                "reasoning": a.reasoning,
+            }
+            for a in ranked_articles
+        ],
+    }
 
 
 if __name__ == "__main__":
 
     async def main():
-        result = await curate_digests(hours=24)
+        try:
+            result = await curate_digests(hours=24)
+        finally:
+            await http.close()
         print("\n=== Curation Results ===")
         print(f"Total digests: {result['total']}")
         print(f"Ranked: {result['ranked']}")
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from app.db.connection import session_scope
+from app.db.batch import BatchWriter
+from app.db.repo import Repository
+from app.services.dedup import LSHIndex, minhash
+from app.settings import settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def process_duplicates() -> dict:
+    async with session_scope() as session:
+        repo = Repository(session=session)
+
+        since = datetime.utcnow() - timedelta(days=settings.dedup_window_days)
+        index = LSHIndex()
+        canonical = {}
+        for fp in await repo.get_fingerprints(since=since):
+            index.add(fp.id, list(fp.signature))
+            canonical[fp.id] = fp.duplicate_of or fp.id
+
+        async def save(batch):
+            await repo.bulk_create_fingerprints(list(batch.values()))
+
+        writer = BatchWriter(save, settings.fingerprint_batch_size)
+        duplicates = 0
+        # Oldest first, so the earliest copy of a story stays canonical.
+        async for article in repo.iter_articles_without_digest(
+            skip_duplicates=False,
+            skip_fingerprinted=True,
+            newest_first=False,
+            resolve_content=True,
+        ):
+            key = f"{article['type']}:{article['id']}"
+            # A stale fingerprint of this item must not match its new content.
+            index.remove(key)
+            signature = await asyncio.to_thread(
+                minhash, article["content"], settings.dedup_shingle_size
+            )
+            if signature is None:
+                continue
+
+            duplicate_of = None
+            score = None
+            match = index.best_match(signature, settings.dedup_threshold)
+            # An item can't duplicate a story it is itself the original of.
+            if match and canonical[match[0]] != key:
+                duplicate_of = canonical[match[0]]
+                score = match[1]
+                duplicates += 1
+                logger.info(f"{key} is a near-duplicate of {duplicate_of} ({score:.2f})")
+
+            index.add(key, signature)
+            canonical[key] = duplicate_of or key
+            await writer.add(
+                key,
+                {
+                    "id": key,
+                    "article_type": article["type"],
+                    "article_id": article["id"],
+                    "signature": signature,
+                    "duplicate_of": duplicate_of,
+                    "similarity": score,
+                    "content_hash": article["content_hash"],
+                    "published_at": article["published_at"],
+                },
+            )
+
+        await writer.flush()
+
+    return {"fingerprinted": writer.written, "duplicates": duplicates}
+
+
+if __name__ == "__main__":
+
+    async def main():
+        result = await process_duplicates()
+        print(f"Fingerprinted: {result['fingerprinted']}")
+        print(f"Duplicates: {result['duplicates']}")
+
+    asyncio.run(main())
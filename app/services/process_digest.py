@@ -1,8 +1,15 @@
 import asyncio
-from typing import Optional
+import os
+import socket
+import time
+import uuid
+from typing import Dict, List, Optional
 from app.agents.digest import DigestAgent
+from app.db.batch import BatchWriter
 from app.db.repo import Repository
-from app.db.connection import get_session
+from app.db.connection import session_scope
+from app.http_client import http
+from app.settings import settings
 import logging
 
 
@@ -14,73 +21,186 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def process_digests(limit: Optional[int] = None) -> dict:
+def new_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+# Runs `workers` digest workers in this process. Each one leases a batch of
+# pending items, summarizes them and releases the batch, so any number of
+# processes on any number of hosts can share the queue without overlap.
+async def process_digests(
+    limit: Optional[int] = None, workers: Optional[int] = None
+) -> dict:
     agent = DigestAgent()
+    workers = workers or settings.digest_workers
 
     processed = 0
     failed = 0
+    dead_lettered = 0
     total = 0
-
-    async with get_session() as session:
-        repo = Repository(session=session)
-        articles = await repo.get_articles_without_digest(limit=limit)
-        total = len(articles)
-
-        logger.info(f"Starting digest processing for {total} articles")
-
-        for idx, article in enumerate(articles, 1):
-            article_type = article["type"]
-            article_id = article["id"]
-            article_title = (
-                article["title"][:60] + "..."
-                if len(article["title"]) > 60
-                else article["title"]
+    remaining = limit
+
+    # Digest generation waits on the LLM for seconds per item, so reads and
+    # writes each take a short-lived session instead of holding one open.
+    async def save_digests(batch: Dict[str, dict]):
+        nonlocal processed, failed
+        try:
+            async with session_scope() as session:
+                repo = Repository(session=session)
+                await repo.create_digests(list(batch.values()))
+                await repo.clear_failures("digest", list(batch))
+        except Exception as e:
+            failed += len(batch)
+            logger.error(f"✗ Error saving {len(batch)} digests: {e}")
+            # Back the items off like any other failure; otherwise the next
+            # lease picks them straight up and pays for the LLM calls again.
+            await save_failures({key: f"saving digest failed: {e!r}" for key in batch})
+            return
+        processed += len(batch)
+        logger.info(f"✓ Saved {len(batch)} digests")
+
+    async def save_failures(batch: Dict[str, str]):
+        nonlocal dead_lettered
+        try:
+            async with session_scope() as session:
+                repo = Repository(session=session)
+                dead_lettered += await repo.record_failures("digest", batch)
+        except Exception as e:
+            logger.error(f"Could not record {len(batch)} digest failures: {e}")
+
+    async def lease(worker: str) -> List[dict]:
+        nonlocal remaining
+        size = settings.digest_lease_size
+        if remaining is not None:
+            size = min(size, remaining)
+            if size <= 0:
+                return []
+            # Reserved before the query so concurrent workers stay within limit.
+            remaining -= size
+        async with session_scope() as session:
+            items = await Repository(session=session).lease_pending_items(
+                worker, size, settings.digest_lease_seconds
             )
-
-            logger.info(
-                f"[{idx}/{total}] Processing {article_type}: {article_title} (ID: {article_id})"
+        if remaining is not None:
+            remaining += size - len(items)
+        return items
+
+    async def renew(worker: str, item_ids: List[int]):
+        try:
+            async with session_scope() as session:
+                await Repository(session=session).renew_leases(
+                    worker, item_ids, settings.digest_lease_seconds
+                )
+        except Exception as e:
+            # The batch carries on; at worst another worker takes over the
+            # items once the old lease runs out.
+            logger.error(f"Could not renew {len(item_ids)} leases: {e}")
+
+    async def release(worker: str, item_ids: List[int]):
+        try:
+            async with session_scope() as session:
+                await Repository(session=session).release_leases(worker, item_ids)
+        except Exception as e:
+            logger.error(f"Could not release {len(item_ids)} leases: {e}")
+
+    async def summarize(article: dict, digests: BatchWriter, failures: BatchWriter):
+        nonlocal total, failed
+        total += 1
+        article_type = article["type"]
+        article_id = article["id"]
+        key = f"{article_type}:{article_id}"
+        article_title = (
+            article["title"][:60] + "..."
+            if len(article["title"]) > 60
+            else article["title"]
+        )
+
+        logger.info(
+            f"[{total}] Processing {article_type}: {article_title} (ID: {article_id})"
+        )
+
+        try:
+            digest_result = await agent.generate_digest(
+                title=article["title"],
+                content=article["content"],
+                article_type=article_type,
             )
 
-            try:
-                digest_result = await agent.generate_digest(
-                    title=article["title"],
-                    content=article["content"],
-                    article_type=article_type,
+            if digest_result:
+                await digests.add(
+                    key,
+                    {
+                        "article_type": article_type,
+                        "article_id": article_id,
+                        "url": article["url"],
+                        "title": digest_result.title,
+                        "summary": digest_result.summary,
+                        "published_at": article.get("published_at"),
+                        "content_hash": article.get("content_hash"),
+                        "content_item_id": article["item_id"],
+                    },
                 )
-
-                if digest_result:
-                    await repo.create_digest(
-                        article_type=article_type,
-                        article_id=article_id,
-                        url=article["url"],
-                        title=digest_result.title,
-                        summary=digest_result.summary,
-                        published_at=article.get("published_at"),
-                    )
-                    processed += 1
-                    logger.info(
-                        f"✓ Successfully created digest for {article_type} {article_id}"
-                    )
-                else:
-                    failed += 1
-                    logger.warning(
-                        f"✗ Failed to generate digest for {article_type} {article_id}"
-                    )
-            except Exception as e:
+                logger.info(f"✓ Generated digest for {article_type} {article_id}")
+            else:
                 failed += 1
-                logger.error(f"✗ Error processing {article_type} {article_id}: {e}")
+                await failures.add(key, "no digest generated")
+                logger.warning(
+                    f"✗ Failed to generate digest for {article_type} {article_id}"
+                )
+        except Exception as e:
+            failed += 1
+            logger.error(f"✗ Error processing {article_type} {article_id}: {e}")
+            await failures.add(key, repr(e))
+
+    async def run_worker():
+        worker = new_worker_id()
+        digests = BatchWriter(save_digests, settings.digest_batch_size)
+        failures = BatchWriter(save_failures, settings.digest_batch_size)
+
+        while articles := await lease(worker):
+            item_ids = [article["item_id"] for article in articles]
+            renewed_at = time.monotonic()
+            try:
+                for position, article in enumerate(articles):
+                    # Keep the rest of the batch ours while the LLM is slow.
+                    if time.monotonic() - renewed_at > settings.digest_lease_seconds / 2:
+                        await renew(worker, item_ids[position:])
+                        renewed_at = time.monotonic()
+                    await summarize(article, digests, failures)
+                await digests.flush()
+                await failures.flush()
+            finally:
+                # Items that didn't get a digest go back to the queue now
+                # rather than when their lease runs out.
+                await release(worker, item_ids)
+
+    logger.info(f"Starting digest processing with {workers} workers")
+    await asyncio.gather(*[run_worker() for _ in range(workers)])
 
     logger.info(
         f"Processing complete: {processed} processed, {failed} failed out of {total} total"
     )
+    if dead_lettered:
+        logger.warning(f"{dead_lettered} articles moved to dead letter")
 
-    return {"total": total, "processed": processed, "failed": failed}
+    return {
+        "total": total,
+        "processed": processed,
+        "failed": failed,
+        "dead_lettered": dead_lettered,
+        "workers": workers,
+    }
 
 
 if __name__ == "__main__":
+    import sys
 
     async def main():
-        result = await process_digests()
+        workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+        try:
+            result = await process_digests(workers=workers)
+        finally:
+            await http.close()
         print(f"Total articles: {result['total']}")
         print(f"Processed: {result['processed']}")
         print(f"Failed: {result['failed']}")
@@ -1,5 +1,6 @@
 import asyncio
-from app.db.connection import get_session
+from app.db.connection import session_scope
+from app.http_client import http
 import logging
 
 from app.agents.email import EmailAgent, RankedArticleDetail, EmailDigestResponse
@@ -20,51 +21,51 @@ async def generate_email_digest(hours: int = 24, top_n: int = 10) -> EmailDigest
     curator = CuratorAgent(USER_PROFILE)
     email_agent = EmailAgent(USER_PROFILE)
 
-    async with get_session() as session:
-        repo = Repository(session=session)
-
-        digests = await repo.get_recent_digests(hours=hours)
-        total = len(digests)
-
-        if total == 0:
-            logger.warning(f"No digests found from the last {hours} hours")
-            raise ValueError("No digests available")
-
-        logger.info(f"Ranking {total} digests for email generation")
-        ranked_articles = await curator.rank_digests(digests)
-
-        if not ranked_articles:
-            logger.error("Failed to rank digests")
-            raise ValueError("Failed to rank articles")
-
-        logger.info(f"Generating email digest with top {top_n} articles")
-
-        article_details = [
-            RankedArticleDetail(
-                digest_id=a.digest_id,
-                rank=a.rank,
-                relevance_score=a.relevance_score,
-                reasoning=a.reasoning,
-                title=next((d["title"] for d in digests if d["id"] == a.digest_id), ""),
-                summary=next((d["summary"] for d in digests if d["id"] == a.digest_id), ""),
-                url=next((d["url"] for d in digests if d["id"] == a.digest_id), ""),
-                article_type=next((d["article_type"] for d in digests if d["id"] == a.digest_id), "")
-            )
-            for a in ranked_articles
-        ]
-
-        email_digest = await email_agent.create_email_digest(
-            ranked_articles=article_details,
-            total_ranked=len(ranked_articles),
-            limit=top_n,
+    # The ranking and writing calls wait on the LLM, so the session is only
+    # held for the read.
+    async with session_scope() as session:
+        digests = await Repository(session=session).get_recent_digests(hours=hours)
+    total = len(digests)
+
+    if total == 0:
+        logger.warning(f"No digests found from the last {hours} hours")
+        raise ValueError("No digests available")
+
+    logger.info(f"Ranking {total} digests for email generation")
+    ranked_articles = await curator.rank_digests(digests)
+
+    if not ranked_articles:
+        logger.error("Failed to rank digests")
+        raise ValueError("Failed to rank articles")
+
+    logger.info(f"Generating email digest with top {top_n} articles")
+
+    article_details = [
+        RankedArticleDetail(
+            digest_id=a.digest_id,
+            rank=a.rank,
+            relevance_score=a.relevance_score,
+            reasoning=a.reasoning,
+            title=next((d["title"] for d in digests if d["id"] == a.digest_id), ""),
+            summary=next((d["summary"] for d in digests if d["id"] == a.digest_id), ""),
+            url=next((d["url"] for d in digests if d["id"] == a.digest_id), ""),
+            article_type=next((d["article_type"] for d in digests if d["id"] == a.digest_id), "")
         )
+        for a in ranked_articles
+    ]
 
-        logger.info("Email digest generated successfully")
-        logger.info("\n=== Email Introduction ===")
-        logger.info(email_digest.introduction.greeting)
-        logger.info(f"\n{email_digest.introduction.introduction}")
+    email_digest = await email_agent.create_email_digest(
+        ranked_articles=article_details,
+        total_ranked=len(ranked_articles),
+        limit=top_n,
+    )
 
-        return email_digest
+    logger.info("Email digest generated successfully")
+    logger.info("\n=== Email Introduction ===")
+    logger.info(email_digest.introduction.greeting)
+    logger.info(f"\n{email_digest.introduction.introduction}")
+
+    return email_digest
 
 
 async def send_digest_email(hours: int = 24, top_n: int = 10) -> dict:
@@ -98,7 +99,10 @@ async def send_digest_email(hours: int = 24, top_n: int = 10) -> dict:
 if __name__ == "__main__":
 
     async def main():
-        result = await generate_email_digest(hours=24, top_n=10)
+        try:
+            result = await generate_email_digest(hours=24, top_n=10)
+        finally:
+            await http.close()
 
         if "error" in result:
             print(f"Error: {result['error']}")
@@ -1,8 +1,11 @@
 import asyncio
-from app.db.connection import get_session
-from typing import Optional
+from app.db.connection import session_scope
+from typing import Any, Dict, Optional
+from app.scrapers.transcript import NormalizedTranscript
 from app.scrapers.youtube import YoutubeScraper
+from app.db.batch import BatchWriter
 from app.db.repo import Repository
+from app.settings import settings
 
 TRANSCRIPT_UNAVAILABLE_MARKER = "__UNAVAILABLE__"
 
@@ -13,39 +16,74 @@ async def process_youtube_transcripts(limit: Optional[int] = None) -> dict:
     processed = 0
     unavailable = 0
     failed = 0
+    dead_lettered = 0
+    raw_chars = 0
+    compact_chars = 0
     videos = []
 
-    async with get_session() as session:
+    async with session_scope() as session:
         repo = Repository(session=session)
-
         videos = await repo.get_youtube_videos_without_transcript(limit=limit)
 
-        for video in videos:
-            try:
-                transcript_result = await scraper.get_transcript(video.video_id)
-                if transcript_result:
-                    if not await repo.update_youtube_video_transcript(
-                        video.video_id, transcript_result.text
-                    ):
-                        raise Exception("Failed to update transcript")
-                    processed += 1
-                else:
-                    if not await repo.update_youtube_video_transcript(
-                        video.video_id, TRANSCRIPT_UNAVAILABLE_MARKER
-                    ):
-                        raise Exception("Failed to update transcript")
-                    unavailable += 1
-            except Exception as e:
-                # if not await repo.update_youtube_video_transcript(video.video_id, TRANSCRIPT_UNAVAILABLE_MARKER):
-                # raise Exception("Failed to update transcript")
-                failed += 1
-                print(f"Error processing video {video.video_id}: {e}")
+    # batch: video_id -> transcript, None when the video has none, or the
+    # exception its fetch failed with.
+    async def write(batch: Dict[str, Any]):
+        nonlocal processed, unavailable, failed, dead_lettered
+        nonlocal raw_chars, compact_chars
+        errors = {v: repr(t) for v, t in batch.items() if isinstance(t, Exception)}
+        results: Dict[str, Optional[NormalizedTranscript]] = {
+            v: t for v, t in batch.items() if not isinstance(t, Exception)
+        }
+        updates = {
+            video_id: t.text if t else TRANSCRIPT_UNAVAILABLE_MARKER
+            for video_id, t in results.items()
+        }
+        raw = {video_id: t.raw for video_id, t in results.items() if t}
+        failed += len(errors)
+        try:
+            async with session_scope() as session:
+                repo = Repository(session=session)
+                # Transient failures leave the transcript empty and back off;
+                # only a definite "no transcript" is stored as unavailable.
+                dead_lettered += await repo.record_failures(
+                    "transcript", {f"youtube:{v}": e for v, e in errors.items()}
+                )
+                await repo.update_youtube_videos_transcript(updates, raw)
+                await repo.clear_failures(
+                    "transcript", [f"youtube:{v}" for v in results]
+                )
+        except Exception as e:
+            failed += len(results)
+            print(f"Error saving transcripts for {len(results)} videos: {e}")
+            return
+        unavailable += len(results) - len(raw)
+        processed += len(raw)
+        raw_chars += sum(len(t.raw) for t in results.values() if t)
+        compact_chars += sum(len(t.text) for t in results.values() if t)
+
+    writer = BatchWriter(write, settings.transcript_batch_size)
+    try:
+        async for video_id, transcript in scraper.get_transcripts(
+            [video.video_id for video in videos]
+        ):
+            if isinstance(transcript, Exception):
+                print(f"Error getting transcript for {video_id}: {transcript}")
+            elif not (transcript and transcript.text):
+                transcript = None
+            await writer.add(video_id, transcript)
+    finally:
+        scraper.close()
+    await writer.flush()
 
     return {
         "total": len(videos),
         "processed": processed,
         "unavailable": unavailable,
         "failed": failed,
+        "dead_lettered": dead_lettered,
+        "compression": round(compact_chars / raw_chars, 3) if raw_chars else None,
+        "flushes": writer.flushes,
+        "proxies": scraper.proxies.snapshot(),
     }
 
 
@@ -1,9 +1,69 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import List, Literal, Optional
+
+
+class SourceConfig(BaseModel):
+    name: str
+    type: Literal["rss", "youtube"] = "rss"
+    url: Optional[str] = None
+    channel_id: Optional[str] = None
+    storage: Literal["rss", "openai", "anthropic", "youtube"] = "rss"
+    poll_interval_minutes: int = 0
+    enabled: bool = True
 
 
 class Settings(BaseSettings):
     youtube_channels: List[str] = ["UC0m81bQuthaQZmFbXEY9QSw"]
+    sources: List[SourceConfig] = []
+
+    scrape_concurrency: int = 32
+    scrape_per_host_concurrency: int = 4
+    scrape_source_timeout: float = 60.0
+
+    transcript_concurrency: int = 8
+    transcript_batch_size: int = 50
+
+    markdown_concurrency: int = 16
+    markdown_batch_size: int = 50
+    markdown_process_workers: Optional[int] = None
+    markdown_max_html_chars: int = 2_000_000
+    markdown_extract_main_content: bool = True
+
+    content_zstd_level: int = 9
+    content_dict_size: int = 112_640
+    content_dict_samples: int = 500
+
+    ingest_chunk_size: int = 1000
+    digest_batch_size: int = 20
+    digest_workers: int = 1
+    digest_lease_size: int = 10
+    digest_lease_seconds: float = 900.0
+    fingerprint_batch_size: int = 200
+    write_flush_interval: float = 5.0
+
+    dedup_threshold: float = 0.5
+    dedup_shingle_size: int = 3
+    dedup_window_days: int = 14
+
+    http_rate_per_host: float = 5.0
+    http_burst_per_host: int = 10
+    http_max_retries: int = 3
+    http_backoff_base: float = 0.5
+    http_backoff_max: float = 30.0
+    http_breaker_threshold: int = 5
+    http_breaker_reset: float = 60.0
+    http_pool_size: int = 100
+    http_pool_per_host: int = 8
+    http_dns_cache_ttl: int = 300
+    http_keepalive_timeout: float = 30.0
+    http_connect_timeout: float = 10.0
+    http_read_timeout: float = 30.0
+    http_total_timeout: float = 60.0
+
+    retry_max_attempts: int = 5
+    retry_backoff_base: float = 900.0
+    retry_backoff_max: float = 86_400.0
 
     postgres_user: str
     postgres_password: str
@@ -11,8 +71,22 @@ class Settings(BaseSettings):
     postgres_host: str = "localhost"
     postgres_port: int = 5432
 
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle: int = 1800
+    db_statement_timeout: float = 60.0
+    db_idle_in_transaction_timeout: float = 300.0
+    db_prepared_statement_cache_size: int = 100
+
     youtube_proxy_username: Optional[str] = None
     youtube_proxy_password: Optional[str] = None
+    youtube_proxies: List[str] = []
+    youtube_proxy_max_in_flight: int = 2
+    youtube_proxy_cooldown: float = 60.0
+    youtube_proxy_max_cooldown: float = 900.0
+    youtube_proxy_acquire_timeout: float = 30.0
 
     openai_api_key: Optional[str] = None
 
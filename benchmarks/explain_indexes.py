@@ -0,0 +1,89 @@
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import text
+
+from app.db.connection import get_engine
+
+# The pipeline's hot queries, with the same predicates the repository uses,
+# and the index each one is expected to use.
+QUERIES = [
+    (
+        "recent digests",
+        "SELECT * FROM digests WHERE created_at >= :cutoff ORDER BY created_at DESC",
+        "ix_digests_created_at",
+    ),
+    (
+        "digest by article",
+        "SELECT id FROM digests WHERE article_type = :type AND article_id = :id",
+        "ix_digests_article",
+    ),
+    (
+        "pending transcripts",
+        "SELECT video_id FROM youtube_videos WHERE transcript IS NULL",
+        "ix_youtube_videos_pending_transcript",
+    ),
+    (
+        "pending markdown",
+        "SELECT guid, url FROM anthropic_articles WHERE markdown IS NULL",
+        "ix_anthropic_articles_pending_markdown",
+    ),
+    (
+        "pending digests",
+        "SELECT id FROM content_items WHERE status = 'pending' "
+        "ORDER BY published_at DESC, id DESC LIMIT 100",
+        "ix_content_items_pending",
+    ),
+    (
+        "dedup window",
+        "SELECT * FROM content_fingerprints WHERE published_at >= :since "
+        "ORDER BY published_at",
+        "ix_content_fingerprints_published_at",
+    ),
+]
+
+
+def plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def main(force: bool = True) -> int:
+    params = {
+        "cutoff": datetime.utcnow() - timedelta(hours=24),
+        "since": datetime.utcnow() - timedelta(days=14),
+        "type": "openai",
+        "id": "example",
+    }
+    missing = 0
+    engine = get_engine()
+    async with engine.connect() as conn:
+        # Small development databases are cheaper to scan than to index, so
+        # sequential scans are discouraged to check the indexes are usable.
+        if force:
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        print(f"{'query':<22} {'expected index':<40} {'plan'}")
+        for name, sql, index in QUERIES:
+            result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            nodes = list(plan_nodes(plan[0]["Plan"]))
+            used = {n["Index Name"] for n in nodes if "Index Name" in n}
+            ok = index in used
+            missing += not ok
+            summary = ", ".join(
+                n["Node Type"] + (f" ({n['Index Name']})" if "Index Name" in n else "")
+                for n in nodes
+            )
+            print(f"{name:<22} {index:<40} {'OK ' if ok else 'MISSING '}{summary}")
+    await engine.dispose()
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(force="--no-force" not in sys.argv)))
@@ -0,0 +1,63 @@
+import sys
+import time
+from pathlib import Path
+
+from html_to_markdown import convert
+
+from app.scrapers.extract import extract_main_content
+
+# The bundled fixtures are synthetic pages padded with script and style
+# blobs. They exercise the extractor but their ratios say nothing about real
+# sites; pass a directory of saved pages for representative numbers.
+FIXTURES = Path(__file__).parent / "fixtures" / "pages"
+# Rough token estimate; close enough for comparing prompt sizes.
+CHARS_PER_TOKEN = 4
+DIGEST_WINDOW = 8000
+
+
+def tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def main(fixture_dir: Path = FIXTURES):
+    pages = sorted(fixture_dir.glob("*.html"))
+    if not pages:
+        print(f"No fixtures found in {fixture_dir}")
+        return
+
+    total_full = total_extracted = 0
+    print(
+        f"{'page':<34} {'html':>8} {'full md':>8} {'main md':>8} "
+        f"{'~tok full':>9} {'~tok main':>9} {'removed':>8} {'ms':>6}"
+    )
+    for page in pages:
+        html = page.read_text()
+        full = convert(html)
+        start = time.perf_counter()
+        extracted = convert(extract_main_content(html))
+        elapsed = (time.perf_counter() - start) * 1000
+
+        total_full += len(full.encode())
+        total_extracted += len(extracted.encode())
+        removed = 1 - len(extracted) / len(full) if full else 0.0
+        print(
+            f"{page.name:<34} {len(html.encode()):>8} {len(full.encode()):>8} "
+            f"{len(extracted.encode()):>8} {tokens(full):>9} {tokens(extracted):>9} "
+            f"{removed:>7.1%} {elapsed:>6.1f}"
+        )
+
+    print(
+        f"\nTotal: {total_full - total_extracted} bytes "
+        f"(~{(total_full - total_extracted) // CHARS_PER_TOKEN} tokens) removed, "
+        f"{1 - total_extracted / total_full:.1%} of converted markdown"
+    )
+    print(
+        f"Digest prompts are truncated at {DIGEST_WINDOW} chars, so removed "
+        "boilerplate becomes room for article text."
+    )
+    if fixture_dir == FIXTURES:
+        print("These are the synthetic fixtures; the ratios are not representative.")
+
+
+if __name__ == "__main__":
+    main(Path(sys.argv[1]) if len(sys.argv) > 1 else FIXTURES)
@@ -0,0 +1,128 @@
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.scrapers.anthropic import AnthropicArticle
+from app.scrapers.feed import FeedEntry
+
+ITEMS = 20_000
+ROUNDS = 5
+
+
+# The pydantic models scraped items used to be built as, kept here as the
+# baseline.
+class PydanticArticle(BaseModel):
+    title: str
+    description: str
+    url: str
+    guid: str
+    published_at: datetime
+    category: Optional[str] = None
+
+
+class PydanticAnthropicArticle(PydanticArticle):
+    pass
+
+
+class PydanticFeeds(BaseModel):
+    anthropic: List[PydanticAnthropicArticle]
+
+
+def make_entries(count: int) -> List[FeedEntry]:
+    now = datetime.now(timezone.utc)
+    return [
+        FeedEntry(
+            title=f"Post {i}",
+            link=f"https://example.com/news/post-{i}",
+            guid=f"https://example.com/news/post-{i}",
+            description="A short summary of the post. " * 4,
+            published_at=now - timedelta(minutes=i),
+            category="News",
+        )
+        for i in range(count)
+    ]
+
+
+def to_row(article) -> Dict[str, Any]:
+    return {
+        "guid": article.guid,
+        "title": article.title,
+        "url": article.url,
+        "published_at": article.published_at,
+        "description": article.description,
+        "category": article.category,
+    }
+
+
+# Parser entry -> scraper item -> copy -> container -> insert row.
+def pydantic_path(entries: List[FeedEntry]) -> List[Dict[str, Any]]:
+    articles = [
+        PydanticArticle(
+            title=e.title,
+            description=e.description,
+            url=e.link,
+            guid=e.guid,
+            published_at=e.published_at,
+            category=e.category,
+        )
+        for e in entries
+    ]
+    articles = [PydanticAnthropicArticle(**a.model_dump()) for a in articles]
+    feeds = PydanticFeeds(anthropic=articles)
+    return [to_row(a) for a in feeds.anthropic]
+
+
+# Parser entry -> record -> insert row.
+def record_path(entries: List[FeedEntry]) -> List[Dict[str, Any]]:
+    articles = [
+        AnthropicArticle(
+            title=e.title,
+            description=e.description,
+            url=e.link,
+            guid=e.guid,
+            published_at=e.published_at,
+            category=e.category,
+        )
+        for e in entries
+    ]
+    return [to_row(a) for a in articles]
+
+
+def measure(path, entries: List[FeedEntry]):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        path(entries)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    rows = path(entries)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return best / len(entries) * 1e6, peak / len(entries)
+
+
+def main(count: int = ITEMS):
+    entries = make_entries(count)
+    print(f"{count} items, best of {ROUNDS} rounds\n")
+    print(f"{'path':<10} {'us/item':>8} {'peak B/item':>12}")
+    results = {}
+    for name, path in (("pydantic", pydantic_path), ("records", record_path)):
+        results[name] = measure(path, entries)
+        us, peak = results[name]
+        print(f"{name:<10} {us:>8.2f} {peak:>12.0f}")
+
+    before, after = results["pydantic"], results["records"]
+    print(
+        f"\nRecords: {before[0] / after[0]:.1f}x faster per item, "
+        f"{1 - after[1] / before[1]:.0%} less peak memory"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ITEMS)
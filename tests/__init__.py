@@ -0,0 +1,9 @@
+import os
+
+# Settings require database credentials at import time; tests never connect.
+for name, value in (
+    ("POSTGRES_USER", "test"),
+    ("POSTGRES_PASSWORD", "test"),
+    ("POSTGRES_DB", "test"),
+):
+    os.environ.setdefault(name, value)
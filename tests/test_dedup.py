@@ -0,0 +1,65 @@
+import unittest
+
+from app.services.dedup import LSHIndex, minhash, shingles, similarity
+
+STORY = (
+    "OpenAI released a new reasoning model today that scores higher on math and "
+    "coding benchmarks while costing less per token than the previous version, "
+    "and it is available to developers through the API starting this week."
+)
+REWORDED = STORY.replace("starting this week", "from Thursday")
+UNRELATED = (
+    "Anthropic published research on interpretability that traces how features "
+    "in a language model combine into circuits for multi-step reasoning tasks."
+)
+
+
+class MinhashTest(unittest.TestCase):
+    def test_identical_text_matches_exactly(self):
+        self.assertEqual(similarity(minhash(STORY), minhash(STORY)), 1.0)
+
+    def test_ignores_case_and_punctuation(self):
+        self.assertEqual(minhash(STORY), minhash(STORY.upper().replace(",", "")))
+
+    def test_empty_text_has_no_signature(self):
+        self.assertIsNone(minhash(""))
+        self.assertIsNone(minhash("!!! ..."))
+
+    def test_short_text_is_one_shingle(self):
+        self.assertEqual(shingles("Hello world", 3), {"hello world"})
+
+    def test_similarity_tracks_overlap(self):
+        close = similarity(minhash(STORY), minhash(REWORDED))
+        far = similarity(minhash(STORY), minhash(UNRELATED))
+        self.assertGreater(close, 0.6)
+        self.assertLess(far, 0.2)
+
+
+class LSHIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = LSHIndex()
+        self.index.add("story", minhash(STORY))
+        self.index.add("unrelated", minhash(UNRELATED))
+
+    def test_finds_near_duplicate_above_threshold(self):
+        match = self.index.best_match(minhash(REWORDED), threshold=0.5)
+        self.assertIsNotNone(match)
+        self.assertEqual(match[0], "story")
+        self.assertGreaterEqual(match[1], 0.5)
+
+    def test_respects_threshold(self):
+        score = similarity(minhash(STORY), minhash(REWORDED))
+        self.assertIsNone(self.index.best_match(minhash(REWORDED), threshold=score + 0.01))
+
+    def test_unrelated_text_has_no_match(self):
+        other = minhash("Weekly roundup of robotics startups raising seed rounds in Europe.")
+        self.assertIsNone(self.index.best_match(other, threshold=0.5))
+
+    def test_removed_key_no_longer_matches(self):
+        self.index.remove("story")
+        self.assertIsNone(self.index.best_match(minhash(STORY), threshold=0.5))
+        self.index.remove("story")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from app.scrapers.extract import extract_main_content
+
+PARAGRAPH = "<p>" + "The model was evaluated on a new benchmark. " * 8 + "</p>"
+
+
+class ExtractMainContentTest(unittest.TestCase):
+    def test_nested_same_tag_children_stay_in_candidate(self):
+        page = (
+            "<html><body><div role=main><div>first para</div>"
+            f"<div>second para {PARAGRAPH}</div><div>third para</div></div>"
+            "<div>unrelated footer text</div></body></html>"
+        )
+        extracted = extract_main_content(page)
+        self.assertIn("first para", extracted)
+        self.assertIn("second para", extracted)
+        self.assertIn("third para", extracted)
+        self.assertNotIn("unrelated footer text", extracted)
+
+    def test_boilerplate_class_on_body_keeps_article(self):
+        page = (
+            '<html><body class="has-sidebar"><nav>Home</nav>'
+            f"<article><h1>Title</h1>{PARAGRAPH}</article></body></html>"
+        )
+        extracted = extract_main_content(page)
+        self.assertIn("<h1>Title</h1>", extracted)
+        self.assertIn("benchmark", extracted)
+        self.assertNotIn("Home", extracted)
+
+    def test_boilerplate_wrapper_around_article_is_kept(self):
+        page = (
+            '<html><body><div class="share-wrapper"><main>'
+            f'<div class="post">{PARAGRAPH}</div>'
+            '<div class="share-links"><a href="/x">Share on X</a></div>'
+            "</main></div></body></html>"
+        )
+        extracted = extract_main_content(page)
+        self.assertIn("benchmark", extracted)
+        self.assertNotIn("Share on X", extracted)
+
+    def test_page_without_candidates_drops_small_boilerplate(self):
+        page = (
+            '<html><body><header>Site name</header><div class="menu">'
+            f'<a href="/">Home</a></div><div class="content">{PARAGRAPH}</div>'
+            "</body></html>"
+        )
+        extracted = extract_main_content(page)
+        self.assertIn("benchmark", extracted)
+        self.assertNotIn("Home", extracted)
+        self.assertNotIn("Site name", extracted)
+
+    def test_short_extraction_falls_back_to_full_page(self):
+        page = "<html><body><p>Too short to trust.</p></body></html>"
+        self.assertEqual(extract_main_content(page), page)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from app.scrapers.feed import parse_entries, read_feed
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+CUTOFF = NOW - timedelta(hours=24)
+
+
+def item(guid: str, hours_ago: float, title: str = "") -> str:
+    published = format_datetime(NOW - timedelta(hours=hours_ago))
+    return (
+        f"<item><title>{title or guid}</title><link>https://example.com/{guid}</link>"
+        f"<guid>{guid}</guid><pubDate>{published}</pubDate>"
+        f"<description>About {guid}</description></item>"
+    )
+
+
+def rss(*items: str, tail: str = "") -> bytes:
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Feed</title>'
+        + "".join(items)
+        + tail
+        + "</channel></rss>"
+    ).encode()
+
+
+class ParseEntriesTest(unittest.TestCase):
+    def test_keeps_entries_newer_than_cutoff(self):
+        entries = parse_entries(rss(item("a", 1), item("b", 2), item("old", 48)), CUTOFF)
+        self.assertEqual([e.guid for e in entries], ["a", "b"])
+        self.assertEqual(entries[0].link, "https://example.com/a")
+        self.assertEqual(entries[0].published_at, NOW - timedelta(hours=1))
+
+    def test_tolerates_a_few_out_of_order_entries(self):
+        entries = parse_entries(rss(item("a", 1), item("old", 48), item("b", 3)), CUTOFF)
+        self.assertEqual([e.guid for e in entries], ["a", "b"])
+
+    def test_stops_after_consecutive_stale_entries(self):
+        # Nothing after the third stale entry is read, not even broken XML.
+        body = rss(
+            item("a", 1),
+            item("old1", 30),
+            item("old2", 31),
+            item("old3", 32),
+            item("late", 2),
+            tail="<item><title>broken &nbsp; entity</title></item>",
+        )
+        entries = parse_entries(body, CUTOFF)
+        self.assertEqual([e.guid for e in entries], ["a"])
+
+    def test_malformed_xml_falls_back_to_feedparser(self):
+        body = rss(item("a", 1), item("b", 2, title="Caf&eacute; news"), item("old", 48))
+        entries = parse_entries(body, CUTOFF)
+        self.assertEqual([e.guid for e in entries], ["a", "b"])
+        self.assertIn("Caf", entries[1].title)
+
+    def test_atom_entries(self):
+        body = (
+            '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            "<entry><title>Post</title><id>urn:post</id>"
+            '<link rel="alternate" href="https://example.com/post"/>'
+            f"<published>{(NOW - timedelta(hours=1)).isoformat()}</published>"
+            "<summary>Text</summary></entry></feed>"
+        ).encode()
+        [entry] = parse_entries(body, CUTOFF)
+        self.assertEqual(entry.guid, "urn:post")
+        self.assertEqual(entry.link, "https://example.com/post")
+        self.assertEqual(entry.description, "Text")
+
+
+class FakeFetcher:
+    def __init__(self, body):
+        self.body = body
+
+    async def fetch(self, url):
+        return self.body
+
+
+class ReadFeedTest(unittest.TestCase):
+    def test_not_modified_feed_has_no_entries(self):
+        entries = asyncio.run(read_feed("https://example.com/feed", CUTOFF, FakeFetcher(None)))
+        self.assertEqual(entries, [])
+
+    def test_parses_fetched_body(self):
+        body = rss(item("a", 1))
+        entries = asyncio.run(read_feed("https://example.com/feed", CUTOFF, FakeFetcher(body)))
+        self.assertEqual([e.guid for e in entries], ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
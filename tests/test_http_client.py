@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+import httpx
+from aiohttp import web
+
+from app.http_client import HttpClient, SharedSessionTransport
+
+
+async def serve():
+    async def hello(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/hello", hello)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class HttpClientTest(unittest.TestCase):
+    def test_new_loop_closes_the_stale_session(self):
+        client = HttpClient()
+
+        async def open_session():
+            return client.session()
+
+        first = asyncio.run(open_session())
+
+        async def reopen():
+            session = client.session()
+            await client.close()
+            return session
+
+        second = asyncio.run(reopen())
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertTrue(second.closed)
+
+    def test_httpx_requests_share_the_session(self):
+        client = HttpClient()
+
+        async def run():
+            runner, base_url = await serve()
+            try:
+                async with httpx.AsyncClient(
+                    transport=SharedSessionTransport(client.session)
+                ) as http:
+                    for _ in range(3):
+                        response = await http.get(f"{base_url}/hello")
+                        self.assertEqual(response.json(), {"ok": True})
+                # Closing the httpx client leaves the shared session open.
+                self.assertFalse(client.session().closed)
+            finally:
+                await client.close()
+                await runner.cleanup()
+
+        asyncio.run(run())
+        self.assertEqual(client.stats["requests"], 3)
+        self.assertEqual(client.stats["connections_created"], 1)
+        self.assertEqual(client.stats["connections_reused"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
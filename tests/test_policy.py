@@ -0,0 +1,163 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from app.scrapers.policy import CircuitBreaker, CircuitOpenError, FetchPolicy, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_policy(**overrides) -> FetchPolicy:
+    options = dict(
+        rate=1000.0,
+        burst=1000,
+        max_retries=2,
+        backoff_base=0.0,
+        backoff_max=0.0,
+        failure_threshold=10,
+        reset_timeout=60.0,
+    )
+    options.update(overrides)
+    return FetchPolicy(**options)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch("app.scrapers.policy.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+
+    def trip(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+    def test_opens_after_threshold(self):
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_open_half_open_closed(self):
+        self.trip()
+        self.clock.now += 31
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_half_open_allows_a_single_probe(self):
+        self.trip()
+        self.clock.now += 31
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+    def test_failed_probe_reopens(self):
+        self.trip()
+        self.clock.now += 31
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+        self.clock.now += 31
+        self.assertTrue(self.breaker.allow())
+
+    def test_abandoned_probe_lets_the_next_caller_probe(self):
+        self.trip()
+        self.clock.now += 31
+        self.assertTrue(self.breaker.allow())
+        self.breaker.abandon()
+        self.assertTrue(self.breaker.allow())
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=50.0, capacity=2)
+            start = time.monotonic()
+            await bucket.acquire()
+            await bucket.acquire()
+            burst = time.monotonic() - start
+            await bucket.acquire()
+            return burst, time.monotonic() - start
+
+        burst, total = asyncio.run(run())
+        self.assertLess(burst, 0.01)
+        self.assertGreaterEqual(total, 0.015)
+
+
+class FetchPolicyTest(unittest.TestCase):
+    def test_retries_until_exhausted(self):
+        policy = make_policy(max_retries=2)
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise asyncio.TimeoutError()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(policy.call("https://example.com/a", failing))
+        self.assertEqual(len(calls), 3)
+        snapshot = policy.snapshot()["example.com"]
+        self.assertEqual(snapshot["retries"], 2)
+        self.assertEqual(snapshot["failures"], 3)
+
+    def test_retry_then_success(self):
+        policy = make_policy()
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 2:
+                raise asyncio.TimeoutError()
+            return "ok"
+
+        self.assertEqual(asyncio.run(policy.call("https://example.com/a", flaky)), "ok")
+        self.assertEqual(policy.host("example.com").breaker.state, CircuitBreaker.CLOSED)
+
+    def test_non_retryable_error_is_not_retried(self):
+        policy = make_policy()
+        calls = []
+
+        async def bad():
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(policy.call("https://example.com/a", bad))
+        self.assertEqual(len(calls), 1)
+
+    def test_open_circuit_short_circuits(self):
+        policy = make_policy(max_retries=0, failure_threshold=1)
+
+        async def failing():
+            raise asyncio.TimeoutError()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(policy.call("https://example.com/a", failing))
+        with self.assertRaises(CircuitOpenError):
+            asyncio.run(policy.call("https://example.com/b", failing))
+        self.assertEqual(policy.snapshot()["example.com"]["short_circuited"], 1)
+
+    def test_backoff_stays_under_the_ceiling(self):
+        policy = make_policy(backoff_base=0.5, backoff_max=4.0)
+        for attempt in range(8):
+            ceiling = min(4.0, 0.5 * 2**attempt)
+            for _ in range(20):
+                self.assertTrue(0 <= policy._backoff(attempt) <= ceiling)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import time
+import unittest
+
+from app.scrapers.proxies import NoHealthyProxyError, ProxyPool, ProxyState
+
+
+def make_pool(*names: str, cooldown: float = 60.0, acquire_timeout: float = 5.0) -> ProxyPool:
+    return ProxyPool(
+        [ProxyState(name, None, max_in_flight=1) for name in names],
+        cooldown=cooldown,
+        max_cooldown=cooldown * 4,
+        acquire_timeout=acquire_timeout,
+    )
+
+
+class ProxyPoolTest(unittest.TestCase):
+    def test_acquire_rotates_across_free_proxies(self):
+        pool = make_pool("a", "b")
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertEqual({first.name, second.name}, {"a", "b"})
+
+    def test_blocked_proxy_is_skipped_while_cooling_down(self):
+        pool = make_pool("a", "b")
+        blocked = pool.acquire()
+        pool.release(blocked, blocked=True)
+        for _ in range(3):
+            proxy = pool.acquire()
+            self.assertNotEqual(proxy.name, blocked.name)
+            pool.release(proxy)
+
+    def test_waits_until_cooldown_ends(self):
+        pool = make_pool("a", cooldown=0.05)
+        pool.release(pool.acquire(), blocked=True)
+        start = time.monotonic()
+        proxy = pool.acquire()
+        elapsed = time.monotonic() - start
+        self.assertEqual(proxy.name, "a")
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertLess(elapsed, 1.0)
+
+    def test_fails_fast_when_cooldown_outlasts_timeout(self):
+        pool = make_pool("a", "b", cooldown=60.0, acquire_timeout=5.0)
+        for _ in range(2):
+            pool.release(pool.acquire(), blocked=True)
+        start = time.monotonic()
+        with self.assertRaises(NoHealthyProxyError):
+            pool.acquire()
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_times_out_when_all_proxies_are_busy(self):
+        pool = make_pool("a", acquire_timeout=0.05)
+        pool.acquire()
+        with self.assertRaises(NoHealthyProxyError):
+            pool.acquire()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from app.scrapers.transcript import normalize_transcript
+
+
+def normalize(*snippets: str) -> str:
+    return normalize_transcript(list(snippets)).text
+
+
+class NormalizeTranscriptTest(unittest.TestCase):
+    def test_real_speech_survives(self):
+        self.assertEqual(
+            normalize("do you know when I say that I mean it"),
+            "Do you know when I say that I mean it",
+        )
+        self.assertEqual(
+            normalize("an HMM tagger, Ah Young said"),
+            "An HMM tagger, Ah Young said",
+        )
+
+    def test_lowercase_hesitations_are_removed(self):
+        self.assertEqual(
+            normalize("so um, we trained uh the erm model"),
+            "So we trained the model",
+        )
+
+    def test_filler_inside_words_is_kept(self):
+        self.assertEqual(normalize("the umbrella and the uhlan"), "The umbrella and the uhlan")
+
+    def test_grammatical_double_words_are_kept(self):
+        self.assertEqual(
+            normalize("she had had enough and said that that was it"),
+            "She had had enough and said that that was it",
+        )
+
+    def test_stutters_of_three_or_more_collapse(self):
+        self.assertEqual(normalize("we we we shipped it"), "We shipped it")
+
+    def test_snippet_overlap_needs_three_words(self):
+        self.assertEqual(
+            normalize("the model is trained on", "is trained on public data"),
+            "The model is trained on public data",
+        )
+        self.assertEqual(
+            normalize("we scaled it up", "up to a thousand GPUs"),
+            "We scaled it up up to a thousand GPUs",
+        )
+
+    def test_non_speech_markers_are_removed(self):
+        self.assertEqual(normalize("[Music] hello (applause) world ♪"), "Hello world")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from app.scrapers.proxies import ProxyPool, ProxyState
+from app.scrapers.transcript import normalize_transcript
+from app.scrapers.youtube import YoutubeScraper
+from app.settings import settings
+
+
+class FakeTranscriptScraper(YoutubeScraper):
+    def _fetch_transcript(self, proxy, video_id):
+        time.sleep(0.02)
+        return normalize_transcript([f"transcript of {video_id} via {proxy.name}"])
+
+
+class GetTranscriptsTest(unittest.TestCase):
+    def test_many_more_videos_than_workers(self):
+        pool = ProxyPool(
+            [ProxyState(name, None, max_in_flight=1) for name in "abcd"],
+            cooldown=60.0,
+            max_cooldown=240.0,
+            acquire_timeout=1.0,
+        )
+        with mock.patch.object(settings, "transcript_concurrency", 4):
+            scraper = FakeTranscriptScraper(proxies=pool)
+        video_ids = [f"v{i}" for i in range(40)]
+
+        async def collect():
+            return [result async for result in scraper.get_transcripts(video_ids)]
+
+        try:
+            results = dict(asyncio.run(collect()))
+        finally:
+            scraper.close()
+
+        self.assertEqual(set(results), set(video_ids))
+        for video_id, result in results.items():
+            self.assertNotIsInstance(result, Exception, video_id)
+            self.assertIn(video_id, result.text)
+        self.assertEqual(sum(p.successes for p in pool.proxies), len(video_ids))
+        self.assertTrue(all(p.in_flight == 0 for p in pool.proxies))
+
+
+if __name__ == "__main__":
+    unittest.main()